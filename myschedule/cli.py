@@ -18,14 +18,30 @@ Note:
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from collections import defaultdict
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from myschedule.conflicts import find_conflicts
-from myschedule.export_ics import export_events_to_ics
-from myschedule.storage import load_selected_course_ids, save_selected_course_ids
+from myschedule import jsonio
+
+if TYPE_CHECKING:
+    from myschedule.search import SearchIndex
+
+# Command-specific modules (conflicts, export_ics, storage, interactive) are imported
+# inside the handlers that need them, so e.g. `myschedule search` or `--help`
+# do not pay for importing code they never run.
+
+# Return type of _load_courses_index():
+# (course_by_id, search_rows, search_index)
+# where search_rows holds one (course_id, display title) per course and
+# search_index the matching lowercased haystacks (same order, see myschedule/search.py).
+_CoursesIndex = tuple[
+    dict[str, dict[str, Any]],
+    list[tuple[str, str]],
+    "SearchIndex",
+]
 
 
 def _processed_dir() -> Path:
@@ -44,78 +60,128 @@ def _load_json(path: Path) -> Any:
     Instead, return [] as a safe default so commands can still run.
     """
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return jsonio.loads(path.read_bytes())
     except FileNotFoundError:
         return []
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    except (OSError, jsonio.JSONDecodeError, UnicodeDecodeError):
         return []
 
 
-def _build_indexes() -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+def _load_courses_index() -> _CoursesIndex:
     """
-    Load courses/events once and create in-memory indexes:
-    - courses list
+    Load courses.json once and create in-memory indexes:
     - course_by_id dict
-    - events_by_course_id dict
+    - search rows + search index (precomputed lowercased search text per course)
     => Avoids repeatedly scanning large lists for every command.
+
+    Courses and events are indexed separately, so commands only load the file they
+    need (search/add never touch events.json, conflicts/export never courses.json).
+    Each result is cached in a pickle sidecar (see myschedule/index_cache.py),
+    so the JSON file is only parsed again after it changed.
+    """
+    from myschedule.index_cache import load_or_build
+
+    courses_path = _processed_dir() / "courses.json"
+    return load_or_build(
+        courses_path.with_name(".cli_courses.pkl"),
+        [courses_path],
+        lambda: _build_courses_index(courses_path),
+    )
+
+
+def _load_events_index() -> dict[str, list[dict[str, Any]]]:
+    """
+    Load events.json once and group the events by course_id (cached like _load_courses_index).
     """
-    processed = _processed_dir()
-    courses_path = processed / "courses.json"
-    events_path = processed / "events.json"
+    from myschedule.index_cache import load_or_build
+
+    events_path = _processed_dir() / "events.json"
+    return load_or_build(
+        events_path.with_name(".cli_events.pkl"),
+        [events_path],
+        lambda: _build_events_index(events_path),
+    )
+
+
+def _build_courses_index(courses_path: Path) -> _CoursesIndex:
+    """
+    Parse courses.json and build the indexes returned by _load_courses_index().
+    """
+    from myschedule.search import build_search_index, course_haystack
 
     courses_raw = _load_json(courses_path)
-    events_raw = _load_json(events_path)
+    # The freshly parsed list is used directly (no defensive copy needed)
+    courses: list[dict[str, Any]] = courses_raw if isinstance(courses_raw, list) else []
 
-    courses: list[dict[str, Any]] = list(courses_raw) if isinstance(courses_raw, list) else []
-    events: list[dict[str, Any]] = list(events_raw) if isinstance(events_raw, list) else []
+    # Course ids are interned: the same few hundred ids key every dict lookup
+    intern = sys.intern
 
     course_by_id: dict[str, dict[str, Any]] = {}
+    search_rows: list[tuple[str, str]] = []
+    haystacks: list[str] = []
     for c in courses:
-        cid = str(c.get("course_id", "")).strip().upper()
+        cid = intern(str(c.get("course_id", "")).strip().upper())
         if cid:
             course_by_id[cid] = c
+        title = str(c.get("title", "") or "").strip()
+        search_rows.append((cid, title if title else "(no title)"))
+        haystacks.append(course_haystack(c))
+
+    return course_by_id, search_rows, build_search_index(haystacks)
+
+
+def _build_events_index(events_path: Path) -> dict[str, list[dict[str, Any]]]:
+    """
+    Parse events.json and build the course_id -> events dict returned by _load_events_index().
+    """
+    events_raw = _load_json(events_path)
+    events: list[dict[str, Any]] = events_raw if isinstance(events_raw, list) else []
+
+    intern = sys.intern
 
     events_by_course_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for e in events:
-        cid = str(e.get("course_id", "")).strip().upper()
+        cid = intern(str(e.get("course_id", "")).strip().upper())
         if cid:
             events_by_course_id[cid].append(e)
 
-    return courses, course_by_id, events_by_course_id
+    # Return a plain dict: lookups must not silently create keys, and it pickles smaller
+    return dict(events_by_course_id)
 
 
-def _cmd_search(args: argparse.Namespace, courses: list[dict[str, Any]]) -> int:
+def _cmd_search(
+    args: argparse.Namespace, search_rows: list[tuple[str, str]], search_index: SearchIndex
+) -> int:
     """
     Search courses by substring match in course_id, title, or instructor names.
+
+    Uses the precomputed search rows/index from _load_courses_index().
     """
+    from myschedule.search import iter_matches
+
     query = (args.text or "").strip().lower()
     if not query:
         print("Please provide a search text.")
         return 1
 
-    matches: list[tuple[str, str]] = []
-    for c in courses:
-        cid = str(c.get("course_id", "")).strip().upper()
-        title = str(c.get("title", "") or "").strip()
-        instructors = c.get("instructors", [])
-        instr_text = (
-            " ".join([str(x) for x in instructors]) if isinstance(instructors, list) else str(instructors or "")
-        )
-
-        hay = f"{cid} {title} {instr_text}".lower()
-        if query in hay:
-            pretty_title = title if title else "(no title)"
-            matches.append((cid, pretty_title))
-
-    if not matches:
+    # show max 20; further matches are only counted for the "... and N more" line
+    max_shown = 20
+    shown: list[tuple[str, str]] = []
+    extra = 0
+    for row in iter_matches(search_index, query):
+        if len(shown) < max_shown:
+            shown.append(search_rows[row])
+        else:
+            extra += 1
+
+    if not shown:
         print("No results.")
         return 0
 
-    # show max 20
-    for cid, title in matches[:20]:
+    for cid, title in shown:
         print(f"{cid} | {title}")
-    if len(matches) > 20:
-        print(f"... and {len(matches) - 20} more results")
+    if extra:
+        print(f"... and {extra} more results")
 
     return 0
 
@@ -133,6 +199,8 @@ def _cmd_add(args: argparse.Namespace, course_by_id: dict[str, dict[str, Any]])
     if cid not in course_by_id:
         print(f"Warning: course_id '{cid}' not found in courses.json (adding anyway).")
 
+    from myschedule.storage import load_selected_course_ids, save_selected_course_ids
+
     selected = load_selected_course_ids()
     if cid in selected:
         print(f"Already selected: {cid}")
@@ -153,6 +221,8 @@ def _cmd_remove(args: argparse.Namespace) -> int:
         print("Please provide a course_id.")
         return 1
 
+    from myschedule.storage import load_selected_course_ids, save_selected_course_ids
+
     selected = load_selected_course_ids()
     if cid not in selected:
         print(f"Not selected: {cid}")
@@ -170,16 +240,19 @@ def _selected_events(
     """
     Collect all event dicts for the currently selected courses.
     """
-    out: list[dict[str, Any]] = []
-    for cid in sorted(selected_ids):
-        out.extend(events_by_course_id.get(cid, []))
-    return out
+    per_course = (
+        events_by_course_id[cid] for cid in sorted(selected_ids) if cid in events_by_course_id
+    )
+    return list(chain.from_iterable(per_course))
 
 
 def _cmd_conflicts(args: argparse.Namespace, events_by_course_id: dict[str, list[dict[str, Any]]]) -> int:
     """
     Print all detected conflicts among selected events.
     """
+    from myschedule.conflicts import find_conflicts
+    from myschedule.storage import load_selected_course_ids
+
     selected = load_selected_course_ids()
     events = _selected_events(selected, events_by_course_id)
 
@@ -217,6 +290,9 @@ def _cmd_export(args: argparse.Namespace, events_by_course_id: dict[str, list[di
     """
     Export selected events into an iCalendar (.ics) file.
     """
+    from myschedule.export_ics import export_events_to_ics
+    from myschedule.storage import load_selected_course_ids
+
     selected = load_selected_course_ids()
     events = _selected_events(selected, events_by_course_id)
 
@@ -268,18 +344,9 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    courses, course_by_id, events_by_course_id = _build_indexes()
-
-    if args.command == "search":
-        raise SystemExit(_cmd_search(args, courses))
-    if args.command == "add":
-        raise SystemExit(_cmd_add(args, course_by_id))
+    # Only load/index the JSON data for commands that actually use it
     if args.command == "remove":
         raise SystemExit(_cmd_remove(args))
-    if args.command == "conflicts":
-        raise SystemExit(_cmd_conflicts(args, events_by_course_id))
-    if args.command == "export":
-        raise SystemExit(_cmd_export(args, events_by_course_id))
 
     if args.command == "interactive":
         from myschedule.interactive import run_interactive, build_indexes
@@ -288,4 +355,15 @@ def main(argv: list[str] | None = None) -> None:
         run_interactive(indexes, rebuild_indexes_fn=build_indexes)
         raise SystemExit(0)
 
+    if args.command == "search":
+        _, search_rows, search_index = _load_courses_index()
+        raise SystemExit(_cmd_search(args, search_rows, search_index))
+    if args.command == "add":
+        course_by_id, _, _ = _load_courses_index()
+        raise SystemExit(_cmd_add(args, course_by_id))
+    if args.command == "conflicts":
+        raise SystemExit(_cmd_conflicts(args, _load_events_index()))
+    if args.command == "export":
+        raise SystemExit(_cmd_export(args, _load_events_index()))
+
     raise SystemExit(2)
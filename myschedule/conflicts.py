@@ -9,6 +9,8 @@ Overlap rule (touching endpoints is NOT a conflict):
 
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
 from typing import Any
 
 
@@ -18,6 +20,16 @@ def _time_to_minutes(hhmm: str) -> int:
 
     Raises ValueError if the format or time values are invalid.
     """
+    # Fast path for the canonical zero-padded form ('08:15') produced by the parser:
+    # plain digit arithmetic instead of split() + two int() calls.
+    if len(hhmm) == 5 and hhmm.isascii():
+        b = hhmm.encode("ascii")
+        if b[2] == 58 and b[:2].isdigit() and b[3:].isdigit():  # 58 == ord(":")
+            minutes = (b[0] - 48) * 600 + (b[1] - 48) * 60 + (b[3] - 48) * 10 + (b[4] - 48)
+            if b[3] > 53 or minutes >= 1440:  # minute > 59 / hour > 23
+                raise ValueError(f"Invalid time value: {hhmm!r}")
+            return minutes
+
     parts = hhmm.strip().split(":")
     if len(parts) != 2:
         raise ValueError(f"Invalid time format: {hhmm!r}")
@@ -28,49 +40,55 @@ def _time_to_minutes(hhmm: str) -> int:
     return h * 60 + m
 
 
-def _overlaps(a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
-    """
-    Return True if two time intervals overlap (end == start is allowed, no conflict).
-    """
-    return a_start < b_end and a_end > b_start
-
-
 def find_conflicts(events: list[dict[str, Any]]) -> list[tuple[dict[str, Any], dict[str, Any]]]:
     """
     Find overlapping event pairs (ev1, ev2).
 
-    Each pair appears once (i < j). Two events conflict only if:
+    Each pair appears once, with ev1 starting no later than ev2. Two events conflict only if:
     - same date AND
     - their time intervals overlap
+
+    Events are bucketed by date and each day is swept in start order, so only
+    events of the same day are ever compared (instead of all pairs).
     """
     conflicts: list[tuple[dict[str, Any], dict[str, Any]]] = []
 
-    # Pre-parse times for performance and robustness
-    parsed: list[tuple[str, int, int, dict[str, Any]]] = []
-    for ev in events:
+    # Pre-parse times for performance and robustness, grouped by date.
+    # A semester only uses a few dozen distinct 'HH:MM' strings, so each one is parsed once.
+    by_date: dict[str, list[tuple[int, int, int, dict[str, Any]]]] = defaultdict(list)
+    minutes: dict[str, int] = {}
+    for idx, ev in enumerate(events):
         date = str(ev.get("date", "")).strip()
         start_s = str(ev.get("start", "")).strip()
         end_s = str(ev.get("end", "")).strip()
         if not date or not start_s or not end_s:
             continue
+        start = minutes.get(start_s)
+        end = minutes.get(end_s)
         try:
-            start = _time_to_minutes(start_s)
-            end = _time_to_minutes(end_s)
+            if start is None:
+                start = minutes[start_s] = _time_to_minutes(start_s)
+            if end is None:
+                end = minutes[end_s] = _time_to_minutes(end_s)
         except ValueError:
             continue
         # if end <= start, treat as invalid / skip (avoid weird conflicts)
         if end <= start:
             continue
-        parsed.append((date, start, end, ev))
+        # idx keeps the sort stable (input order) for events with the same start
+        by_date[date].append((start, idx, end, ev))
 
-    # O(n^2) is fine for typical uni schedule sizes
-    for i in range(len(parsed)):
-        d1, s1, e1, ev1 = parsed[i]
-        for j in range(i + 1, len(parsed)):
-            d2, s2, e2, ev2 = parsed[j]
-            if d1 != d2:
-                continue
-            if _overlaps(s1, e1, s2, e2):
-                conflicts.append((ev1, ev2))
+    # Sweep line per day: `active` is a min-heap of (end, idx, event) for events that
+    # started earlier. Entries ending at or before the current start cannot overlap it
+    # (touching endpoints are no conflict); everything left on the heap overlaps.
+    for day in by_date.values():
+        day.sort()
+        active: list[tuple[int, int, dict[str, Any]]] = []
+        for start, idx, end, ev in day:
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, _, other in active:
+                conflicts.append((other, ev))
+            heapq.heappush(active, (end, idx, ev))
 
     return conflicts
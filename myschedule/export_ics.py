@@ -9,82 +9,150 @@ Converts selected events into a standard iCalendar file that can be imported int
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any
-from datetime import datetime, timezone
+from typing import Any, Iterable
+from datetime import date, datetime, timezone
+
+# Single-character ICS escapes, applied in one pass by str.translate
+_ICS_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", "\n": "\\n", ";": "\\;", ",": "\\,"})
 
 
 def _ics_escape(text: str) -> str:
     """
     Escape text for ICS fields (very small subset, sufficient for our use).
+
+    CRLF is folded to LF first, so both become a single '\\n'.
     """
-    return (
-        text.replace("\\", "\\\\").replace("\r\n", "\\n").replace("\n", "\\n").replace(";", "\\;").replace(",", "\\,")
-    )
+    if "\r\n" in text:
+        text = text.replace("\r\n", "\n")
+    return text.translate(_ICS_ESCAPE_TABLE)
 
 
 def _dt_local(date_yyyy_mm_dd: str, time_hh_mm: str) -> str:
     """
     Convert date + time to ICS local datetime string 'YYYYMMDDTHHMM00'.
+
+    Raises ValueError if date or time are invalid.
     """
-    dt = datetime.strptime(f"{date_yyyy_mm_dd} {time_hh_mm}", "%Y-%m-%d %H:%M")
+    d, t = date_yyyy_mm_dd, time_hh_mm
+    # Fast path for the canonical 'YYYY-MM-DD' + 'HH:MM' shape (all parsed data):
+    # the output is just the digits, so slice instead of going through strptime.
+    if len(d) == 10 and d[4] == "-" and d[7] == "-" and len(t) == 5 and t[2] == ":":
+        ymd = d[:4] + d[5:7] + d[8:]
+        hm = t[:2] + t[3:]
+        if ymd.isascii() and ymd.isdigit() and hm.isascii() and hm.isdigit():
+            # validates month/day, raises ValueError
+            date(int(ymd[:4]), int(ymd[4:6]), int(ymd[6:]))
+            if int(hm[:2]) > 23 or int(hm[2:]) > 59:
+                raise ValueError(f"Invalid time value: {t!r}")
+            return f"{ymd}T{hm}00"
+
+    # Anything else (e.g. '9:15') keeps the lenient strptime behavior
+    dt = datetime.strptime(f"{d} {t}", "%Y-%m-%d %H:%M")
     return dt.strftime("%Y%m%dT%H%M00")
 
 
-def export_events_to_ics(events: list[dict[str, Any]], out_path: str | Path) -> int:
+# Fixed calendar header/footer (ICS standard uses CRLF line endings)
+_CALENDAR_HEADER = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//MySchedule//EN\r\nCALSCALE:GREGORIAN\r\n"
+)
+_CALENDAR_FOOTER = "END:VCALENDAR\r\n"
+
+# Per-event output templates, filled with format_map (fields already escaped)
+_VEVENT_TMPL = (
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}\r\n"
+    "DTSTAMP:{dtstamp}\r\n"
+    "DTSTART:{dtstart}\r\n"
+    "DTEND:{dtend}\r\n"
+    "SUMMARY:{summary}\r\n"
+)
+_LOCATION_TMPL = "LOCATION:{}\r\n"
+_DESCRIPTION_TMPL = "DESCRIPTION:{}\r\n"
+_VEVENT_END = "END:VEVENT\r\n"
+
+
+def export_events_to_ics(events: Iterable[dict[str, Any]], out_path: str | Path) -> int:
     """
     Export events to an .ics file. Returns number of exported events.
+
+    Each event is rendered from a fixed template and written straight to the file
+    instead of being collected in memory first. `events` is only iterated once,
+    so a generator works as well as a list.
+
+    The file is written to a temporary sibling and then renamed over out_path,
+    so an export that fails halfway never leaves a truncated .ics behind.
     """
     out = Path(out_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: list[str] = []
-    lines.append("BEGIN:VCALENDAR")
-    lines.append("VERSION:2.0")
-    lines.append("PRODID:-//MySchedule//EN")
-    lines.append("CALSCALE:GREGORIAN")
+    tmp_path = out.with_name(out.name + ".tmp")
+    try:
+        count = _write_calendar(events, tmp_path)
+        os.replace(tmp_path, out)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    return count
+
+
+def _write_calendar(events: Iterable[dict[str, Any]], path: Path) -> int:
+    """
+    Write the complete calendar for `events` to path. Returns number of written events.
+    """
+    # UTC timestamp required by the iCalendar specification.
+    # It marks the export time, so it is the same for every event.
+    dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    # Template fields of the current event; dtstamp is shared, the rest is overwritten per event
+    row: dict[str, str] = {"dtstamp": dtstamp}
 
     count = 0
-    for ev in events:
-        course_id = str(ev.get("course_id", "")).strip()
-        title = str(ev.get("title", "")).strip()
-        date = str(ev.get("date", "")).strip()
-        start = str(ev.get("start", "")).strip()
-        end = str(ev.get("end", "")).strip()
-        location = str(ev.get("location", "")).strip()
-        note = ev.get("note", None)
-        event_id = str(ev.get("event_id", "")).strip()
-
-        if not (date and start and end):
-            continue
+    # newline="" keeps the explicit CRLF line endings untouched on every platform;
+    # the larger buffer turns the per-event writes into few system calls
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+        write = f.write
+        write(_CALENDAR_HEADER)
+
+        for ev in events:
+            course_id = str(ev.get("course_id", "")).strip()
+            title = str(ev.get("title", "")).strip()
+            date_s = str(ev.get("date", "")).strip()
+            start = str(ev.get("start", "")).strip()
+            end = str(ev.get("end", "")).strip()
+            location = str(ev.get("location", "")).strip()
+            note = ev.get("note", None)
+            event_id = str(ev.get("event_id", "")).strip()
+
+            if not (date_s and start and end):
+                continue
+
+            try:
+                dtstart = _dt_local(date_s, start)
+                dtend = _dt_local(date_s, end)
+            except ValueError:
+                continue
+
+            summary = f"{course_id} {title}".strip() if course_id or title else "MySchedule Event"
+            uid = event_id if event_id else f"{course_id}-{dtstart}"
+
+            row["uid"] = _ics_escape(uid)
+            row["dtstart"] = dtstart
+            row["dtend"] = dtend
+            row["summary"] = _ics_escape(summary)
+            text = _VEVENT_TMPL.format_map(row)
+            if location:
+                text += _LOCATION_TMPL.format(_ics_escape(location))
+            if isinstance(note, str) and note.strip():
+                text += _DESCRIPTION_TMPL.format(_ics_escape(note.strip()))
+            write(text + _VEVENT_END)
+            count += 1
+
+        write(_CALENDAR_FOOTER)
 
-        try:
-            dtstart = _dt_local(date, start)
-            dtend = _dt_local(date, end)
-        except ValueError:
-            continue
-
-        summary = f"{course_id} {title}".strip() if course_id or title else "MySchedule Event"
-        uid = event_id if event_id else f"{course_id}-{dtstart}"
-
-        lines.append("BEGIN:VEVENT")
-        lines.append(f"UID:{_ics_escape(uid)}")
-
-        # UTC timestamp required by the iCalendar specification
-        dtstamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        lines.append(f"DTSTAMP:{dtstamp}")
-        lines.append(f"DTSTART:{dtstart}")
-        lines.append(f"DTEND:{dtend}")
-        lines.append(f"SUMMARY:{_ics_escape(summary)}")
-        if location:
-            lines.append(f"LOCATION:{_ics_escape(location)}")
-        if isinstance(note, str) and note.strip():
-            lines.append(f"DESCRIPTION:{_ics_escape(note.strip())}")
-        lines.append("END:VEVENT")
-        count += 1
-
-    lines.append("END:VCALENDAR")
-
-    # ICS standard uses CRLF
-    out.write_text("\r\n".join(lines) + "\r\n", encoding="utf-8")
     return count
@@ -0,0 +1,103 @@
+"""
+On-disk cache for in-memory indexes.
+
+Parsing courses.json/events.json and building the lookup dicts is the most
+expensive part of every command, while the JSON files themselves only change
+after a scrape + parse run.
+
+This module pickles the built indexes into a sidecar file next to the JSON data:
+
+    data/processed/.<name>.pkl
+
+Each sidecar starts with a stamp (mtime + size of every source file). On the next
+run the stamp is compared first; if it still matches, the pickled indexes are
+returned and the JSON is never parsed. Any mismatch, missing or broken cache
+simply falls back to a normal build, which then overwrites the sidecar.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from pathlib import Path
+from typing import Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Bump whenever the structure of cached objects changes, so stale caches are ignored.
+CACHE_FORMAT = 6
+
+
+def _source_stamp(sources: Sequence[Path]) -> tuple[object, ...] | None:
+    """
+    Build the cache stamp for the given source files.
+
+    Returns None if any source file is missing (nothing worth caching yet).
+    """
+    try:
+        stats = [os.stat(p) for p in sources]
+    except OSError:
+        return None
+    return (CACHE_FORMAT,) + tuple((st.st_mtime_ns, st.st_size) for st in stats)
+
+
+def _read_cache(cache_path: Path, stamp: tuple[object, ...]) -> tuple[bool, object]:
+    """
+    Return (True, value) if cache_path holds a value for exactly this stamp.
+    """
+    try:
+        with cache_path.open("rb") as f:
+            # stamp and value are pickled separately, so a stale cache is
+            # rejected without unpickling the (large) value
+            if pickle.load(f) != stamp:
+                return False, None
+            return True, pickle.load(f)
+    except FileNotFoundError:
+        return False, None
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ):
+        return False, None
+
+
+def _write_cache(cache_path: Path, stamp: tuple[object, ...], value: object) -> None:
+    """
+    Atomically write stamp + value to cache_path. Failures are ignored (cache is optional).
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            pickle.dump(stamp, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_or_build(cache_path: Path, sources: Sequence[Path], build: Callable[[], T]) -> T:
+    """
+    Return the cached value for `sources`, or call `build()` and cache its result.
+
+    The stamp is taken before building, so if a source changes while building,
+    the next call sees a different stamp and rebuilds again.
+    """
+    stamp = _source_stamp(sources)
+    if stamp is None:
+        return build()
+
+    hit, value = _read_cache(cache_path, stamp)
+    if hit:
+        return value  # type: ignore[return-value]
+
+    built = build()
+    _write_cache(cache_path, stamp, built)
+    return built
@@ -40,7 +40,7 @@ This file intentionally centralizes TUI logic for maintainability.
 #    9.6) Timetable (Week View)
 #    9.7) Export (.ics)
 #    9.8) Update Data (scrape + parse + metadata)
-# 10) Subprocess / System Layer (scrape/parse subprocess runners)
+# 10) Subprocess / System Layer (scrape/parse runners, in-process or subprocess)
 # ============================================================
 
 
@@ -50,27 +50,37 @@ This file intentionally centralizes TUI logic for maintainability.
 
 from __future__ import annotations
 
-import json
-import subprocess
+import os
+import re
 import sys
 
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
+from functools import lru_cache
+from heapq import merge
+from itertools import count, groupby, zip_longest
+from operator import itemgetter
 
 from pathlib import Path
-from typing import Any, Callable, Optional
+from time import monotonic
+from typing import Any, Callable, Iterator, Optional
 
-from myschedule.conflicts import find_conflicts
+from myschedule import jsonio
+from myschedule.conflicts import _time_to_minutes, find_conflicts
 from myschedule.export_ics import export_events_to_ics
+from myschedule.search import SearchIndex, build_search_index, course_haystack, iter_matches
 from myschedule.storage import load_selected_course_ids, save_selected_course_ids
 
 # Optional rich
+# (rich.progress is only needed by [8] Update data and is imported there;
+#  subprocess likewise is imported by the flows that start processes)
 try:
     from rich.console import Console
     from rich.table import Table
+    from rich.text import Text
     from rich import box
-    from rich.progress import Progress, BarColumn, TimeRemainingColumn, TextColumn
 
     HAS_RICH = True
     console = Console()
@@ -97,6 +107,10 @@ META_PATH = PROCESSED_DIR / "metadata.json"
 # =========================
 
 
+# (date, start_minutes, end_minutes, event) of one event with valid times
+_EventSpan = tuple[str, int, int, dict[str, Any]]
+
+
 @dataclass
 class Indexes:
     """
@@ -104,12 +118,83 @@ class Indexes:
 
     - courses: list of all courses (raw dicts as loaded from courses.json)
     - course_by_id: lookup by course_id
-    - events_by_course_id: course_id -> list of event dicts
+    - events_by_course_id: course_id -> list of event dicts, in chronological order
+    - spans_by_course_id: course_id -> (date, start_minutes, end_minutes, event) rows,
+      only for events with valid times (others never conflict, same rule as
+      find_conflicts). Conflict checks compare these ints instead of reading dicts.
+    - dates_by_course_id: course_id -> set of dates of those rows
+    - spans_by_course_and_date: (course_id, date) -> the rows of that course on that date
+    - search_index: lowercased search text per course, same order as courses
+      (see myschedule/search.py)
+
+    Every indexed event dict carries precomputed fields:
+    - "_cid" = normalized (stripped, uppercased) course_id, the key it is indexed under
+    - "_sort_key" = (date, start) for chronological sorting
+    - "_date" = stripped date, the key events are grouped by per day
+    - "_day" = that date parsed (datetime.date), None if it is not a valid ISO date
+    - "_week" = ISO (year, week) of "_day", None if "_day" is None
+    Selected events also get "_line" (display line) the first time _event_line formats them.
+
+    version identifies this build of the indexes (a new one after every reload),
+    so caches derived from the indexes can tell when they are stale.
     """
 
     courses: list[dict[str, Any]]
     course_by_id: dict[str, dict[str, Any]]
     events_by_course_id: dict[str, list[dict[str, Any]]]
+    spans_by_course_id: dict[str, list[_EventSpan]]
+    dates_by_course_id: dict[str, frozenset[str]]
+    spans_by_course_and_date: dict[tuple[str, str], list[_EventSpan]]
+    search_index: SearchIndex
+    version: int = 0
+
+
+# Source of Indexes.version values (see build_indexes)
+_INDEX_VERSIONS = count(1)
+
+
+@dataclass
+class SelectedState:
+    """
+    The user's course selection and the events derived from it.
+
+    - ids: selected course_ids (persisted in selected_courses.json)
+    - events: all events of the selected courses in chronological order
+      (same list _selected_events would build)
+
+    add()/remove() persist the selection and update events in place,
+    so the event list never has to be rebuilt from all selected courses.
+    """
+
+    ids: set[str]
+    events: list[dict[str, Any]]
+
+    @classmethod
+    def load(cls, indexes: Indexes, ids: Optional[set[str]] = None) -> SelectedState:
+        """Load the persisted selection (or use the given ids) and collect its events."""
+        if ids is None:
+            ids = load_selected_course_ids()
+        return cls(ids=ids, events=_selected_events(ids, indexes.events_by_course_id))
+
+    def add(self, cid: str, indexes: Indexes) -> None:
+        """Select a course (persisted immediately) and merge in its events."""
+        if cid in self.ids:
+            return
+        self.ids.add(cid)
+        save_selected_course_ids(self.ids)
+        new_events = indexes.events_by_course_id.get(cid)
+        if new_events:
+            self.events.extend(new_events)
+            # already sorted + one sorted run appended: Timsort merges this in linear time
+            self.events.sort(key=_SELECTED_EVENT_ORDER)
+
+    def remove(self, cid: str) -> None:
+        """Deselect a course (persisted immediately) and drop its events."""
+        if cid not in self.ids:
+            return
+        self.ids.remove(cid)
+        save_selected_course_ids(self.ids)
+        self.events = [ev for ev in self.events if ev["_cid"] != cid]
 
 
 # =========================
@@ -128,6 +213,21 @@ def _println(msg: str = "") -> None:
         print(msg)
 
 
+def _println_lines(lines: list[Any]) -> None:
+    """
+    Print several lines with one call (one terminal write instead of one per line).
+
+    With Rich, lines may also be pre-styled Text objects (printed without markup parsing).
+    """
+    if not lines:
+        return
+    if HAS_RICH:
+        assert console is not None
+        console.print(*lines, sep="\n")
+    else:
+        print("\n".join(lines))
+
+
 def _print_separator() -> None:
     """Visual separator between menu screens."""
     _println("\n" + "-" * 60 + "\n")
@@ -163,10 +263,10 @@ def _load_json(path: Path) -> Any:
     so the interactive app can continue without crashing.
     """
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return jsonio.loads(path.read_bytes())
     except FileNotFoundError:
         return []
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    except (OSError, jsonio.JSONDecodeError, UnicodeDecodeError):
         return []
 
 
@@ -189,43 +289,139 @@ def build_indexes() -> Indexes:
     - dict: course_id -> list of events
 
     Returns empty indexes if no processed data exists yet (first run).
+
+    The built indexes are cached in a pickle sidecar (see myschedule/index_cache.py),
+    so the JSON files are only parsed again after a scrape + parse run changed them.
     """
+    from myschedule.index_cache import load_or_build
+
     courses_path = PROCESSED_DIR / "courses.json"
     events_path = PROCESSED_DIR / "events.json"
 
     # Onboarding safety: allow interactive mode even before first scrape
     if not courses_path.exists() or not events_path.exists():
-        return Indexes(
-            courses=[],
-            course_by_id={},
-            events_by_course_id=defaultdict(list),
-        )
+        return _empty_indexes()
+
+    indexes = load_or_build(
+        PROCESSED_DIR / ".interactive_indexes.pkl",
+        [courses_path, events_path],
+        lambda: _build_indexes(courses_path, events_path),
+    )
+    # A cached copy carries the version of the process that built it; caches keyed
+    # by version (labels, pair conflicts) need a version unique to this process
+    indexes.version = next(_INDEX_VERSIONS)
+    return indexes
 
+
+def _empty_indexes() -> Indexes:
+    """
+    Indexes without any courses or events (no processed data yet).
+    """
+    return Indexes(
+        courses=[],
+        course_by_id={},
+        events_by_course_id={},
+        spans_by_course_id={},
+        dates_by_course_id={},
+        spans_by_course_and_date={},
+        search_index=build_search_index([]),
+        version=next(_INDEX_VERSIONS),
+    )
+
+
+def _build_indexes(courses_path: Path, events_path: Path) -> Indexes:
+    """
+    Parse courses.json/events.json and build the indexes returned by build_indexes().
+    """
     courses_raw = _load_json(courses_path)
     events_raw = _load_json(events_path)
 
     courses: list[dict[str, Any]] = list(courses_raw) if isinstance(courses_raw, list) else []
     events: list[dict[str, Any]] = list(events_raw) if isinstance(events_raw, list) else []
 
+    # Course ids and dates are interned: a few hundred ids and dates key every
+    # dict/set lookup, comparison and sort, and equal interned strings compare by identity
+    intern = sys.intern
+
     course_by_id: dict[str, dict[str, Any]] = {}
     for c in courses:
-        cid = _safe_str(c.get("course_id")).strip().upper()
+        cid = intern(_safe_str(c.get("course_id")).strip().upper())
         if cid:
             course_by_id[cid] = c
 
+    # parsed date + ISO week per distinct date string (a few hundred), shared by its events
+    day_and_week: dict[str, tuple[Optional[date], Optional[tuple[int, int]]]] = {}
+
     events_by_course_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    spans_by_course_id: dict[str, list[_EventSpan]] = defaultdict(list)
+    spans_by_course_and_date: dict[tuple[str, str], list[_EventSpan]] = defaultdict(list)
     for e in events:
-        cid = _safe_str(e.get("course_id")).strip().upper()
+        cid = intern(_safe_str(e.get("course_id")).strip().upper())
         if cid:
+            # chronological sort key, computed once instead of on every sort;
+            # date and start are converted once here and reused by the other fields
+            date_raw = intern(_safe_str(e.get("date")))
+            e["_sort_key"] = (date_raw, _safe_str(e.get("start")))
+            e["_cid"] = cid
+            ds = e["_date"] = intern(date_raw.strip())
+            dw = day_and_week.get(ds)
+            if dw is None:
+                dd = _parse_iso_date(ds)
+                iso = dd.isocalendar() if dd else None
+                dw = day_and_week[ds] = (dd, (iso[0], iso[1]) if iso else None)
+            e["_day"], e["_week"] = dw
             events_by_course_id[cid].append(e)
-
+            span = _event_span(e)
+            if span is not None:
+                row = (*span, e)
+                spans_by_course_id[cid].append(row)
+                spans_by_course_and_date[cid, span[0]].append(row)
+
+    # Each course's events in chronological order (stable: same-time events keep file
+    # order), so the selected events can be merged instead of sorted (_selected_events)
+    by_time = itemgetter("_sort_key")
+    for course_events in events_by_course_id.values():
+        course_events.sort(key=by_time)
+
+    # Plain dict: lookups must not silently create keys (all call sites use .get / `in`)
     return Indexes(
         courses=courses,
         course_by_id=course_by_id,
-        events_by_course_id=events_by_course_id,
+        events_by_course_id=dict(events_by_course_id),
+        spans_by_course_id=dict(spans_by_course_id),
+        dates_by_course_id={
+            cid: frozenset(row[0] for row in rows) for cid, rows in spans_by_course_id.items()
+        },
+        spans_by_course_and_date=dict(spans_by_course_and_date),
+        search_index=build_search_index([course_haystack(c) for c in courses]),
+        version=next(_INDEX_VERSIONS),
     )
 
 
+def _event_span(ev: dict[str, Any]) -> Optional[tuple[str, int, int]]:
+    """
+    Parse an event's date/start/end into (date, start_minutes, end_minutes).
+    Date and start come from the precomputed "_date" and "_sort_key" (set in
+    build_indexes before this is called).
+
+    Returns None for events that can never conflict (missing date/time, invalid
+    time or end not after start), matching the rules of find_conflicts.
+    """
+    d = ev["_date"]
+    start = ev["_sort_key"][1].strip()
+    end = _safe_str(ev.get("end")).strip()
+    if not d or not start or not end:
+        return None
+    try:
+        start_min = _time_to_minutes(start)
+        end_min = _time_to_minutes(end)
+    except ValueError:
+        return None
+    if end_min <= start_min:
+        return None
+    return d, start_min, end_min
+
+
 def _read_metadata() -> dict[str, Any]:
     """
     Load scrape metadata (semester, timestamp, counts).
@@ -235,9 +431,10 @@ def _read_metadata() -> dict[str, Any]:
     if not META_PATH.exists():
         return {}
     try:
-        return json.loads(META_PATH.read_text(encoding="utf-8"))
+        data = jsonio.loads(META_PATH.read_bytes())
     except Exception:
         return {}
+    return data if isinstance(data, dict) else {}
 
 
 def _write_metadata(semester: str, courses_count: int, events_count: int) -> None:
@@ -253,7 +450,7 @@ def _write_metadata(semester: str, courses_count: int, events_count: int) -> Non
         "courses": courses_count,
         "events": events_count,
     }
-    META_PATH.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    META_PATH.write_bytes(jsonio.dumps_pretty(data))
 
 
 # =========================
@@ -261,6 +458,11 @@ def _write_metadata(semester: str, courses_count: int, events_count: int) -> Non
 # =========================
 
 
+# Order of selected events: date, start, then course_id (precomputed in build_indexes).
+# Ties keep their input order, so the list is the same however it was assembled.
+_SELECTED_EVENT_ORDER = itemgetter("_sort_key", "_cid")
+
+
 def _selected_events(
     selected_ids: set[str], events_by_course_id: dict[str, list[dict[str, Any]]]
 ) -> list[dict[str, Any]]:
@@ -270,19 +472,20 @@ def _selected_events(
     Events are merged across courses and sorted by date and start time
     for consistent display in agenda and timetable views.
     """
-    out: list[dict[str, Any]] = []
-    for cid in sorted(selected_ids):
-        out.extend(events_by_course_id.get(cid, []))
-    # Global chronological order across all selected courses
-    out.sort(key=lambda ev: (_safe_str(ev.get("date")), _safe_str(ev.get("start"))))
-    return out
+    # Global chronological order across all selected courses: each course's list is
+    # already in order (build_indexes), so the lists are merged instead of sorted
+    return list(
+        merge(
+            *(events_by_course_id[cid] for cid in selected_ids if cid in events_by_course_id),
+            key=_SELECTED_EVENT_ORDER,
+        )
+    )
 
 
-def _print_header(selected: set[str], events: list[dict[str, Any]]) -> None:
+def _print_header(selected: set[str], events: list[dict[str, Any]], meta: dict[str, Any]) -> None:
     """
-    Print the interactive header with metadata and current selection stats.
+    Print the interactive header with metadata (see _read_metadata) and current selection stats.
     """
-    meta = _read_metadata()
     if meta:
         last = _safe_str(meta.get("last_scraped"))
         sem = _safe_str(meta.get("semester"))
@@ -297,6 +500,40 @@ def _print_header(selected: set[str], events: list[dict[str, Any]]) -> None:
     _println(f"Selected courses: {len(selected)} | Selected events: {len(events)}")
 
 
+# Parsed ISO dates by string. A semester only has a few dozen distinct dates, so
+# every string is parsed once per session instead of once per event and render.
+# Capped like the other caches, so malformed data cannot grow it without bound.
+_PARSE_DATE_CACHE: dict[str, Optional[date]] = {}
+_PARSE_DATE_CACHE_MAX = 4096
+
+
+def _parse_iso_date(s: str) -> Optional[date]:
+    """
+    Parse an ISO date string (YYYY-MM-DD). Returns None if invalid.
+    """
+    try:
+        return _PARSE_DATE_CACHE[s]
+    except KeyError:
+        pass
+
+    dd: Optional[date]
+    try:
+        y, m, d = s[:4], s[5:7], s[8:]
+        digits = y + m + d
+        if len(s) == 10 and s[4] == "-" and s[7] == "-" and digits.isascii() and digits.isdigit():
+            # canonical form: plain int slicing (date() still validates month/day)
+            dd = date(int(y), int(m), int(d))
+        else:
+            # anything else keeps the strptime rules (e.g. '2026-2-9')
+            dd = datetime.strptime(s, "%Y-%m-%d").date()
+    except ValueError:
+        dd = None
+    if len(_PARSE_DATE_CACHE) >= _PARSE_DATE_CACHE_MAX:
+        _PARSE_DATE_CACHE.clear()
+    _PARSE_DATE_CACHE[s] = dd
+    return dd
+
+
 def _short_instructors(course: dict[str, Any]) -> str:
     """
     Build a short instructor label for compact table display.
@@ -373,12 +610,50 @@ def _course_label(
     return " | ".join(bits)
 
 
+@lru_cache(maxsize=1024)
+def _placeholder_course(cid: str) -> dict[str, Any]:
+    """
+    Stand-in course for a course_id that is not in courses.json.
+
+    Shared per id (do not modify), so lookups don't allocate a default dict every time.
+    """
+    return {"course_id": cid, "title": ""}
+
+
+# Course labels: (indexes.version, course_id, rich) -> label
+_LABEL_CACHE: dict[tuple[int, str, bool], str] = {}
+_LABEL_CACHE_MAX = 4096
+
+
+def _course_label_cached(cid: str, indexes: Indexes, rich: bool = False) -> str:
+    """
+    Label of the course with this course_id (see _course_label), memoized per indexes build.
+
+    Unknown ids get a placeholder label (course not found in courses.json).
+    """
+    key = (indexes.version, cid, rich)
+    label = _LABEL_CACHE.get(key)
+    if label is None:
+        if len(_LABEL_CACHE) >= _LABEL_CACHE_MAX:
+            _LABEL_CACHE.clear()
+        course = indexes.course_by_id.get(cid) or _placeholder_course(cid)
+        label = _LABEL_CACHE[key] = _course_label(course, indexes.events_by_course_id, rich=rich)
+    return label
+
+
 def _event_line(ev: dict[str, Any]) -> str:
     """
     Format a single event into a compact one-line string for display.
 
     Example: '10:15-12:00 | FS261110 | Public Economics (lecture) @ HS 8'
+
+    The line is stored on the event ("_line") the first time, so redrawing the
+    agenda/timetable/conflict views does not format the same event again.
     """
+    line: Optional[str] = ev.get("_line")
+    if line is not None:
+        return line
+
     cid = _safe_str(ev.get("course_id")).strip()
     title = (_safe_str(ev.get("title")) or "").strip()
     start = _safe_str(ev.get("start")).strip()
@@ -390,7 +665,8 @@ def _event_line(ev: dict[str, Any]) -> str:
         bits.append(f"({kind})")
     if loc:
         bits.append(f"@ {loc}")
-    return " | ".join([b for b in bits if b])
+    line = ev["_line"] = " | ".join([b for b in bits if b])
+    return line
 
 
 # =========================
@@ -398,37 +674,72 @@ def _event_line(ev: dict[str, Any]) -> str:
 # =========================
 
 
-def _conflicts_if_added(
+# Conflicts between two courses: (indexes.version, candidate_cid, other_cid) -> pairs
+_PAIR_CONFLICT_CACHE: dict[tuple[int, str, str], list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+_PAIR_CONFLICT_CACHE_MAX = 4096
+
+
+def _course_pair_conflicts(
     candidate_cid: str,
-    selected_ids: set[str],
-    events_by_course_id: dict[str, list[dict[str, Any]]],
+    other_cid: str,
+    indexes: Indexes,
 ) -> list[tuple[dict[str, Any], dict[str, Any]]]:
     """
-    Returns conflict pairs where one event is from the candidate course and
-    the other event is from already selected courses.
+    Conflict pairs (candidate_event, other_event) between two courses, memoized per indexes build.
+
+    The result only depends on the two courses, so it stays valid while the selection
+    changes: previewing a course again (or another course against the same selected
+    ones) only computes the pairs not seen before. The returned list is shared and
+    must not be modified.
     """
-    cand_events = events_by_course_id.get(candidate_cid, [])
-    if not cand_events or not selected_ids:
-        return []
+    key = (indexes.version, candidate_cid, other_cid)
+    pairs = _PAIR_CONFLICT_CACHE.get(key)
+    if pairs is not None:
+        return pairs
+
+    pairs = []
+    spans_by_course_and_date = indexes.spans_by_course_and_date
+    shared = indexes.dates_by_course_id[candidate_cid] & indexes.dates_by_course_id[other_cid]
+    for d in sorted(shared):
+        other_rows = sorted(spans_by_course_and_date[other_cid, d], key=itemgetter(1))
+        starts = [r[1] for r in other_rows]
+        for _, cand_start, cand_end, cand_ev in spans_by_course_and_date[candidate_cid, d]:
+            # Overlap rule (touching endpoints is NOT a conflict): other starts before the
+            # candidate ends (bisect) and ends after the candidate starts (checked below)
+            for _, _, other_end, other_ev in other_rows[: bisect_left(starts, cand_end)]:
+                if other_end > cand_start:
+                    pairs.append((cand_ev, other_ev))
+
+    if len(_PAIR_CONFLICT_CACHE) >= _PAIR_CONFLICT_CACHE_MAX:
+        _PAIR_CONFLICT_CACHE.clear()
+    _PAIR_CONFLICT_CACHE[key] = pairs
+    return pairs
 
-    # Collect all events of currently selected courses
-    selected_events: list[dict[str, Any]] = []
-    for cid in selected_ids:
-        selected_events.extend(events_by_course_id.get(cid, []))
 
-    # Run your existing engine
-    all_pairs = find_conflicts(selected_events + cand_events)
+def _conflicts_if_added(
+    candidate_cid: str,
+    state: SelectedState,
+    indexes: Indexes,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """
+    Yields conflict pairs where one event is from the candidate course and
+    the other event is from already selected courses.
+
+    Pairs are normalized as (candidate_event, other_event) and grouped by selected
+    course. Only candidate events are checked against the selected ones (never
+    selected vs selected), one selected course at a time (see _course_pair_conflicts).
+    """
+    selected_ids = state.ids
+    if not selected_ids or not indexes.spans_by_course_id.get(candidate_cid):
+        return
 
-    # Filter to only pairs that involve candidate course vs selected courses
-    out: list[tuple[dict[str, Any], dict[str, Any]]] = []
-    for a, b in all_pairs:
-        a_c = _safe_str(a.get("course_id")).strip().upper()
-        b_c = _safe_str(b.get("course_id")).strip().upper()
-        if a_c == candidate_cid and b_c in selected_ids:
-            out.append((a, b))
-        elif b_c == candidate_cid and a_c in selected_ids:
-            out.append((b, a))  # normalize: (candidate_event, other_event)
-    return out
+    # Only selected courses sharing a date with the candidate can conflict with it.
+    # Usually that rules out most (or all) of the selection.
+    cand_dates = indexes.dates_by_course_id[candidate_cid]
+    dates_by_course_id = indexes.dates_by_course_id
+    for cid in sorted(selected_ids):
+        if cid in dates_by_course_id and not cand_dates.isdisjoint(dates_by_course_id[cid]):
+            yield from _course_pair_conflicts(candidate_cid, cid, indexes)
 
 
 def _show_candidate_conflict_details(
@@ -444,43 +755,34 @@ def _show_candidate_conflict_details(
         _println("No conflicts.")
         return
 
-    # group by other course id
-    by_other: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]] = defaultdict(list)
-    for cand_ev, other_ev in pairs:
-        other_cid = _safe_str(other_ev.get("course_id")).strip().upper()
-        by_other[other_cid].append((cand_ev, other_ev))
-
-    cand_course = indexes.course_by_id.get(candidate_cid, {"course_id": candidate_cid, "title": ""})
-    cand_label = _course_label(cand_course, indexes.events_by_course_id)
-
-    _println(f"\nConflicts for candidate course:\n- {cand_label}\n")
-
-    # Overview: one line per conflicting course
+    cand_label = _course_label_cached(candidate_cid, indexes)
 
-    for other_cid in sorted(by_other.keys()):
-        other_course = indexes.course_by_id.get(other_cid, {"course_id": other_cid, "title": ""})
-        other_label = _course_label(other_course, indexes.events_by_course_id)
-        n = len(by_other[other_cid])
-        _println(f"* {other_label}  →  {n} conflicts")
-
-    # Detailed list of every conflicting event pair
-    _println("\nDetails:")
+    # The whole screen is collected first and printed at once. Overview (one line per
+    # conflicting course) and details (every conflicting event pair) are filled in the
+    # same pass over the other courses.
+    overview: list[Any] = [f"\nConflicts for candidate course:\n- {cand_label}\n"]
+    details: list[Any] = ["\nDetails:"]
     i = 1
-    for other_cid in sorted(by_other.keys()):
-        other_course = indexes.course_by_id.get(other_cid, {"course_id": other_cid, "title": ""})
-        other_label = _course_label(other_course, indexes.events_by_course_id)
-        _println(f"\n=== With: {other_label} ===")
-        for cand_ev, other_ev in sorted(
-            by_other[other_cid], key=lambda p: (_safe_str(p[0].get("date")), _safe_str(p[0].get("start")))
-        ):
+    # One sort by (other course, candidate event time), then group by other course
+    ordered = sorted(pairs, key=lambda p: (p[1]["_cid"], p[0]["_sort_key"]))
+    for other_cid, group in groupby(ordered, key=lambda p: p[1]["_cid"]):
+        other_pairs = list(group)
+        other_label = _course_label_cached(other_cid, indexes)
+        overview.append(f"* {other_label}  →  {len(other_pairs)} conflicts")
+        details.append(f"\n=== With: {other_label} ===")
+        for cand_ev, other_ev in other_pairs:
             left = _event_line(cand_ev)
             right = _event_line(other_ev)
             if HAS_RICH:
-                _println(f"{i}) [red]{left}[/]  <->  [red]{right}[/]")
+                # styled spans instead of markup: nothing to parse, and brackets in
+                # titles stay literal
+                details.append(Text.assemble(f"{i}) ", (left, "red"), "  <->  ", (right, "red")))
             else:
-                _println(f"{i}) ! {left}  <->  ! {right}")
+                details.append(f"{i}) ! {left}  <->  ! {right}")
             i += 1
 
+    _println_lines(overview + details)
+
     _prompt("\nPress Enter to go back: ")
 
 
@@ -514,11 +816,24 @@ def run_interactive(indexes: Indexes, rebuild_indexes_fn: Callable[[], Indexes])
             return
     # --- main menu loop ---
 
+    # The selection is checked every turn: load_selected_course_ids is memoized on the
+    # file's mtime/size, so an unchanged file costs one stat. Its events are only rebuilt
+    # when the ids changed (e.g. `myschedule add/remove` in another terminal) or the data
+    # was replaced by [8] (dirty); flows [1]/[3] update `state` and the file together.
+    # Metadata only changes with [8].
+    state = SelectedState.load(indexes)
+    meta = _read_metadata()
+    dirty = False
     while True:
-        selected = load_selected_course_ids()
-        events = _selected_events(selected, indexes.events_by_course_id)
+        ids = load_selected_course_ids()
+        if dirty or ids != state.ids:
+            state = SelectedState.load(indexes, ids)
+        if dirty:
+            meta = _read_metadata()
+            dirty = False
+        events = state.events
 
-        _print_header(selected, events)
+        _print_header(state.ids, events, meta)
 
         choice = _prompt(
             "\n[1] Search + add course\n"
@@ -540,11 +855,11 @@ def run_interactive(indexes: Indexes, rebuild_indexes_fn: Callable[[], Indexes])
             return
 
         if choice == "1":
-            _flow_search_add(indexes, selected)
+            _flow_search_add(indexes, state)
         elif choice == "2":
-            _flow_view_selected(indexes, selected)
+            _flow_view_selected(indexes, state.ids)
         elif choice == "3":
-            _flow_remove(indexes, selected)
+            _flow_remove(indexes, state)
         elif choice == "4":
             _flow_conflicts(indexes, events)
         elif choice == "5":
@@ -558,6 +873,7 @@ def run_interactive(indexes: Indexes, rebuild_indexes_fn: Callable[[], Indexes])
             if ok:
                 # Reload fresh JSON into memory
                 indexes = rebuild_indexes_fn()
+                dirty = True
                 _println("Data reloaded into interactive session.")
         else:
             _println("Invalid choice.")
@@ -570,11 +886,21 @@ def run_interactive(indexes: Indexes, rebuild_indexes_fn: Callable[[], Indexes])
 #    9.1) Search + Add
 
 
-def _flow_search_add(indexes: Indexes, selected: set[str]) -> None:
+def _flow_search_add(indexes: Indexes, state: SelectedState) -> None:
     """
     Search courses and add them. After adding (or already-selected), ask whether
     user wants to add more courses without returning to main menu.
     """
+    courses = indexes.courses
+
+    def match_label(row: int, cid: str, rich: bool = False) -> str:
+        """Label of the matched course itself; the memoized label if it is the indexed one."""
+        course = courses[row]
+        if indexes.course_by_id.get(cid) is course:
+            return _course_label_cached(cid, indexes, rich=rich)
+        # empty or duplicate course_id: label the matched dict, not the indexed course
+        return _course_label(course, indexes.events_by_course_id, rich=rich)
+
     while True:
         query = (
             _prompt("Search text or code (e.g., 'finance' or 'FS261107') [blank = new search, 0 = back]: ")
@@ -587,37 +913,37 @@ def _flow_search_add(indexes: Indexes, selected: set[str]) -> None:
         if not query:
             continue
 
-        matches: list[dict[str, Any]] = []
-        for c in indexes.courses:
-            cid = _safe_str(c.get("course_id")).strip().upper()
-            title = (_safe_str(c.get("title")) or "").strip()
-            instructors = c.get("instructors", [])
-            instr_text = (
-                " ".join([_safe_str(x) for x in instructors])
-                if isinstance(instructors, list)
-                else _safe_str(instructors)
-            )
-            hay = f"{cid} {title} {instr_text}".lower()
-            if query in hay:
-                matches.append(c)
+        # Precomputed haystacks (course_id, title, instructors); only the first 20 hits
+        # that are not selected yet are shown, the scan stops there
+        matches: list[tuple[int, str]] = []  # (row in courses, normalized course_id)
+        n_selected = 0
+        for row in iter_matches(indexes.search_index, query):
+            cid = _safe_str(courses[row].get("course_id")).strip().upper()
+            if cid in state.ids:
+                n_selected += 1
+                continue
+            matches.append((row, cid))
+            if len(matches) == 20:
+                break
 
         if not matches:
-            _println("No results.")
+            if n_selected:
+                _println("No results (all matching courses are already selected).")
+            else:
+                _println("No results.")
             continue
 
-        matches = matches[:20]
-
         if HAS_RICH:
             table = Table(title="Search results (max 20)", box=box.SIMPLE)  # type: ignore
             table.add_column("#", justify="right")
             table.add_column("Course")
-            for i, c in enumerate(matches, start=1):
-                table.add_row(str(i), _course_label(c, indexes.events_by_course_id, rich=True))
+            for i, (row, cid) in enumerate(matches, start=1):
+                table.add_row(str(i), match_label(row, cid, rich=True))
             console.print(table)  # type: ignore
         else:
             _println("Search results (max 20):")
-            for i, c in enumerate(matches, start=1):
-                _println(f"{i}) {_course_label(c, indexes.events_by_course_id)}")
+            for i, (row, cid) in enumerate(matches, start=1):
+                _println(f"{i}) {match_label(row, cid)}")
 
         # User chooses which course to add by index
         pick = _prompt("Enter number to add [blank = new search, 0 = back]: ").strip()
@@ -635,21 +961,21 @@ def _flow_search_add(indexes: Indexes, selected: set[str]) -> None:
             _println("Out of range.")
             continue
 
-        cid = _safe_str(matches[i - 1].get("course_id")).strip().upper()
+        cid = matches[i - 1][1]
         if not cid:
             _println("Invalid course_id.")
             continue
 
-        if cid in selected:
+        if cid in state.ids:
             _println(f"Already selected: {cid}")
         else:
 
             # --- conflict preview before adding ---
             # Simulate adding the course and warn if it creates schedule overlaps
-            pairs = _conflicts_if_added(cid, selected, indexes.events_by_course_id)
+            pairs = list(_conflicts_if_added(cid, state, indexes))
 
             if pairs:
-                other_courses = sorted({_safe_str(b.get("course_id")).strip().upper() for (_, b) in pairs})
+                other_courses = sorted({b["_cid"] for (_, b) in pairs})
                 n_courses = len(other_courses)
                 n_events = len(pairs)
 
@@ -662,8 +988,7 @@ def _flow_search_add(indexes: Indexes, selected: set[str]) -> None:
                 while True:
                     ans = _prompt("Add anyway? [Y]=add, [N]=cancel, [D]=details: ").strip().lower()
                     if ans == "y" or ans == "":
-                        selected.add(cid)
-                        save_selected_course_ids(selected)
+                        state.add(cid, indexes)
                         _println(f"Added: {cid}")
                         break
                     if ans == "n" or ans == "0":
@@ -675,8 +1000,7 @@ def _flow_search_add(indexes: Indexes, selected: set[str]) -> None:
                         continue
                     _println("Invalid input.")
             else:
-                selected.add(cid)
-                save_selected_course_ids(selected)
+                state.add(cid, indexes)
                 _println(f"Added: {cid}")
 
         # Ask whether user wants to continue adding courses
@@ -704,9 +1028,8 @@ def _flow_view_selected(indexes: Indexes, selected: set[str]) -> None:
         table.add_column("Course")
 
         for cid in sorted(selected):
-            c = indexes.course_by_id.get(cid)
-            if c:
-                table.add_row(_course_label(c, indexes.events_by_course_id, rich=True))
+            if cid in indexes.course_by_id:
+                table.add_row(_course_label_cached(cid, indexes, rich=True))
             else:
                 missing_events = len(indexes.events_by_course_id.get(cid, []))
                 table.add_row(f"[bold cyan]{cid}[/] | (not found in courses.json) | {missing_events} events")
@@ -717,9 +1040,8 @@ def _flow_view_selected(indexes: Indexes, selected: set[str]) -> None:
     # Fallback: plain terminal output (no Rich installed)
     items: list[str] = []
     for cid in sorted(selected):
-        c = indexes.course_by_id.get(cid)
-        if c:
-            items.append(_course_label(c, indexes.events_by_course_id))
+        if cid in indexes.course_by_id:
+            items.append(_course_label_cached(cid, indexes))
         else:
             items.append(
                 f"{cid} | (not found in courses.json) | {len(indexes.events_by_course_id.get(cid, []))} events"
@@ -733,7 +1055,7 @@ def _flow_view_selected(indexes: Indexes, selected: set[str]) -> None:
 #    9.3) Remove
 
 
-def _flow_remove(indexes: Indexes, selected: set[str]) -> None:
+def _flow_remove(indexes: Indexes, state: SelectedState) -> None:
     """
     Interactive removal flow for selected courses.
 
@@ -741,32 +1063,31 @@ def _flow_remove(indexes: Indexes, selected: set[str]) -> None:
     one or multiple courses. Uses Rich tables if available, otherwise prints
     plain text.
     """
-    if not selected:
+    if not state.ids:
         _println("No courses selected.")
         return
 
+    # Sorted once; removals below delete from it by position, so it stays sorted
+    ids = sorted(state.ids)
+
     while True:
         # Selection may become empty after removals
-        if not selected:
+        if not ids:
             _println("No courses selected.")
             return
 
-        ids = sorted(selected)
-
         # Display numbered list of selected courses
         if HAS_RICH:
             table = Table(title="Remove course", box=box.SIMPLE)  # type: ignore
             table.add_column("#", justify="right")
             table.add_column("Course")
             for i, cid in enumerate(ids, start=1):
-                c = indexes.course_by_id.get(cid, {"course_id": cid, "title": ""})
-                table.add_row(str(i), _course_label(c, indexes.events_by_course_id, rich=True))
+                table.add_row(str(i), _course_label_cached(cid, indexes, rich=True))
             console.print(table)  # type: ignore
         else:
             _println("Remove course:")
             for i, cid in enumerate(ids, start=1):
-                c = indexes.course_by_id.get(cid, {"course_id": cid, "title": ""})
-                _println(f"{i}) {_course_label(c, indexes.events_by_course_id)}")
+                _println(f"{i}) {_course_label_cached(cid, indexes)}")
 
         pick = _prompt("Enter number to remove (or blank to cancel): ").strip()
         if not pick:
@@ -781,9 +1102,8 @@ def _flow_remove(indexes: Indexes, selected: set[str]) -> None:
             continue
 
         # Remove selected course ID and persist it immediately
-        cid = ids[idx - 1]
-        selected.remove(cid)
-        save_selected_course_ids(selected)
+        cid = ids.pop(idx - 1)
+        state.remove(cid)
         _println(f"Removed: {cid}")
 
         more = _prompt("Remove another course? [Y/n]: ").strip().lower()
@@ -812,13 +1132,13 @@ def _flow_conflicts(indexes: Indexes, events: list[dict[str, Any]]) -> None:
         return
 
     # Sort for stable order
-    confs = sorted(confs, key=lambda p: (_safe_str(p[0].get("date")), _safe_str(p[0].get("start"))))
+    confs = sorted(confs, key=lambda p: p[0]["_sort_key"])
 
     def _course_pair_label(cid: str, rich: bool) -> str:
         """
         Build a compact label for a course (id | title | type) for UI display.
         """
-        c = indexes.course_by_id.get(cid, {"course_id": cid, "title": "", "type": ""})
+        c = indexes.course_by_id.get(cid) or _placeholder_course(cid)
 
         title = (_safe_str(c.get("title")) or "").strip()
         ctype = (_safe_str(c.get("type")) or "").strip()
@@ -840,30 +1160,16 @@ def _flow_conflicts(indexes: Indexes, events: list[dict[str, Any]]) -> None:
 
         return " | ".join(parts)
 
-    def _pair_key(a: dict[str, Any], b: dict[str, Any]) -> tuple[str, str]:
-        """
-        Build a stable (courseA, courseB) key independent of order.
-
-        Ensures (A,B) and (B,A) are treated as the same conflict pair.
-        """
-        ca = _safe_str(a.get("course_id")).strip().upper()
-        cb = _safe_str(b.get("course_id")).strip().upper()
-        return (ca, cb) if ca <= cb else (cb, ca)
-
-    # Group conflicts by course-pair
-    by_pair: dict[tuple[str, str], list[tuple[dict[str, Any], dict[str, Any]]]] = defaultdict(list)
-    involved_courses: set[str] = set()
-
+    # Group conflicts by course-pair in one pass. The key is a stable (courseA, courseB)
+    # tuple independent of order, so (A,B) and (B,A) are the same conflict pair.
+    # Each group keeps the date/start order of confs.
+    by_pair: dict[tuple[str, str], list[tuple[dict[str, Any], dict[str, Any]]]] = {}
     for a, b in confs:
-        ca = _safe_str(a.get("course_id")).strip().upper()
-        cb = _safe_str(b.get("course_id")).strip().upper()
-        if not ca or not cb:
-            continue
-        involved_courses.add(ca)
-        involved_courses.add(cb)
-        by_pair[_pair_key(a, b)].append((a, b))
-
+        ca = a["_cid"]
+        cb = b["_cid"]
+        by_pair.setdefault((ca, cb) if ca <= cb else (cb, ca), []).append((a, b))
     pairs_sorted = sorted(by_pair.items(), key=lambda item: (-len(item[1]), item[0]))
+    involved_courses = {cid for key, _ in pairs_sorted for cid in key}
 
     total_confs = len(confs)
     total_courses = len(involved_courses)
@@ -871,29 +1177,35 @@ def _flow_conflicts(indexes: Indexes, events: list[dict[str, Any]]) -> None:
     _println(f"Conflicts found: {total_confs}")
     _println(f"Courses involved in conflicts: {total_courses}")
 
+    # The overview does not change while this flow runs, so it is built once
+    # and shown again after every detail view
+    if HAS_RICH:
+        table = Table(box=box.SIMPLE, title="Conflict pairs")  # type: ignore
+        table.add_column("#", justify="right")
+        table.add_column("Pair")
+        table.add_column("Conflicts", justify="right")
+
+        for i, ((c1, c2), lst) in enumerate(pairs_sorted, start=1):
+            pair_label = f"{_course_pair_label(c1, rich=True)}  ↔  {_course_pair_label(c2, rich=True)}"
+            table.add_row(str(i), pair_label, f"[yellow]{len(lst)}[/]")
+
+        # Extra option: show complete flat list
+        table.add_row(str(len(pairs_sorted) + 1), "[bold]Show ALL conflicts[/]", f"[yellow]{total_confs}[/]")
+    else:
+        overview_lines = [
+            f"{i}) {_course_pair_label(c1, rich=False)}  <->  {_course_pair_label(c2, rich=False)}  ({len(lst)} conflicts)"
+            for i, ((c1, c2), lst) in enumerate(pairs_sorted, start=1)
+        ]
+        overview_lines.append(f"{len(pairs_sorted)+1}) Show ALL conflicts ({total_confs})")
+
     # Loop so user can inspect multiple pairs without re-entering menu
     while True:
         _println("\nConflict overview (by course pair):")
 
         if HAS_RICH:
-            table = Table(box=box.SIMPLE, title="Conflict pairs")  # type: ignore
-            table.add_column("#", justify="right")
-            table.add_column("Pair")
-            table.add_column("Conflicts", justify="right")
-
-            for i, ((c1, c2), lst) in enumerate(pairs_sorted, start=1):
-                pair_label = f"{_course_pair_label(c1, rich=True)}  ↔  {_course_pair_label(c2, rich=True)}"
-                table.add_row(str(i), pair_label, f"[yellow]{len(lst)}[/]")
-
-            # Extra option: show complete flat list
-            table.add_row(str(len(pairs_sorted) + 1), "[bold]Show ALL conflicts[/]", f"[yellow]{total_confs}[/]")
             console.print(table)  # type: ignore
         else:
-            for i, ((c1, c2), lst) in enumerate(pairs_sorted, start=1):
-                _println(
-                    f"{i}) {_course_pair_label(c1, rich=False)}  <->  {_course_pair_label(c2, rich=False)}  ({len(lst)} conflicts)"
-                )
-            _println(f"{len(pairs_sorted)+1}) Show ALL conflicts ({total_confs})")
+            _println_lines(overview_lines)
 
         pick = _prompt("Select number for details, or 0 to go back: ").strip()
         if pick == "0" or pick == "":
@@ -944,38 +1256,22 @@ def _flow_agenda(events: list[dict[str, Any]]) -> None:
     # Step 1: Precompute all conflicts to mark overlapping events
     conf_pairs = find_conflicts(events)
 
-    def event_key(ev: dict[str, Any]) -> tuple[str, str, str, str]:
-        """
-        Stable event identifier used for conflict marking.
-
-        We avoid relying on event_id and instead use core time identity.
-        """
-        return (
-            _safe_str(ev.get("date")),
-            _safe_str(ev.get("start")),
-            _safe_str(ev.get("end")),
-            _safe_str(ev.get("course_id")),
-        )
+    # find_conflicts returns the event dicts themselves, so identity marks them
+    conflict_ids = {id(ev) for pair in conf_pairs for ev in pair}
 
-    conflict_keys: set[tuple[str, str, str, str]] = set()
-    for a, b in conf_pairs:
-        conflict_keys.add(event_key(a))
-        conflict_keys.add(event_key(b))
+    # Highlight style is fixed for the whole run, so it is chosen once and not per event
+    mark_conflict = "[red]{}[/]".format if HAS_RICH else "! {}".format
 
     def fmt_event(ev: dict[str, Any]) -> str:
         """Format one event line and highlight it if it is part of a conflict."""
         txt = _event_line(ev)
-        if event_key(ev) in conflict_keys:
-            if HAS_RICH:
-                return f"[red]{txt}[/]"
-            return f"! {txt}"
-        return txt
+        return mark_conflict(txt) if id(ev) in conflict_ids else txt
 
     # Step 2: Group all events by date (YYYY-MM-DD)
 
     by_date: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for ev in events:
-        d = _safe_str(ev.get("date")).strip()
+        d = ev["_date"]
         if d:
             by_date[d].append(ev)
 
@@ -984,19 +1280,8 @@ def _flow_agenda(events: list[dict[str, Any]]) -> None:
         names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         return names[d.weekday()]
 
-    def parse_date(s: str) -> Optional[date]:
-        """Parse ISO date string (YYYY-MM-DD). Returns None if invalid."""
-        try:
-            return datetime.strptime(s, "%Y-%m-%d").date()
-        except Exception:
-            return None
-
-    def week_key(d: date) -> tuple[int, int]:
-        """Return ISO (year, week) tuple used for grouping weeks."""
-        iso = d.isocalendar()
-        return (iso.year, iso.week)
-
     # Step 3: Build mapping: ISO week → list of date strings
+    # (all events of a date share its parsed "_day"/"_week", precomputed in build_indexes)
 
     # sort all dates
     sorted_dates = sorted(by_date.keys())
@@ -1004,10 +1289,10 @@ def _flow_agenda(events: list[dict[str, Any]]) -> None:
     # build mapping week -> dates
     week_to_dates: dict[tuple[int, int], list[str]] = defaultdict(list)
     for ds in sorted_dates:
-        dd = parse_date(ds)
-        if dd is None:
+        wk = by_date[ds][0]["_week"]
+        if wk is None:
             continue
-        week_to_dates[week_key(dd)].append(ds)
+        week_to_dates[wk].append(ds)
 
     weeks = sorted(week_to_dates.keys())
 
@@ -1016,7 +1301,7 @@ def _flow_agenda(events: list[dict[str, Any]]) -> None:
 
     ## Step 4: Show legend if conflicts exist
 
-    if conflict_keys:
+    if conflict_ids:
         if HAS_RICH:
             _println("Legend: [red]CONFLICT[/] = overlaps detected")
         else:
@@ -1035,27 +1320,27 @@ def _flow_agenda(events: list[dict[str, Any]]) -> None:
         # decide which weeks to show this page
         page_weeks = weeks[idx:] if show_all else weeks[idx : idx + WEEKS_PER_PAGE]
 
+        # The page is collected first and printed with one call
+        page: list[str] = []
         for y, w in page_weeks:
             # week header
             mon = date.fromisocalendar(y, w, 1)
             sun = mon + timedelta(days=6)
             if HAS_RICH:
-                _println(
+                page.append(
                     f"\n[bold cyan]=== {y}-W{w:02d} ({mon.isoformat()} → {sun.isoformat()}) ==============================[/]"
                 )
             else:
-                _println(f"\n=== {y}-W{w:02d} ({mon.isoformat()} → {sun.isoformat()}) ===")
+                page.append(f"\n=== {y}-W{w:02d} ({mon.isoformat()} → {sun.isoformat()}) ===")
 
             # dates inside week
             for ds in week_to_dates[(y, w)]:
-                dd = parse_date(ds)
-                if dd:
-                    _println(f"\n{ds} ({weekday_short(dd)})")
-                else:
-                    _println(f"\n{ds}")
+                # dates in week_to_dates always parsed
+                page.append(f"\n{ds} ({weekday_short(by_date[ds][0]['_day'])})")
 
-                for ev in sorted(by_date[ds], key=lambda x: _safe_str(x.get("start"))):
-                    _println(f"  - {fmt_event(ev)}")
+                for ev in sorted(by_date[ds], key=lambda x: x["_sort_key"][1]):
+                    page.append(f"  - {fmt_event(ev)}")
+        _println_lines(page)
 
         if show_all:
             return  # done
@@ -1085,42 +1370,50 @@ def _flow_timetable_week(events: list[dict[str, Any]]) -> None:
         _println("No selected events.")
         return
 
-    def parse_date(s: str) -> Optional[date]:
-        """Parse ISO date string (YYYY-MM-DD). Returns None if invalid."""
-        try:
-            return datetime.strptime(s, "%Y-%m-%d").date()
-        except Exception:
-            return None
-
-    def week_key(d: date) -> tuple[int, int]:
-        """Return short weekday label used for table columns."""
-        iso = d.isocalendar()
-        return (iso.year, iso.week)
-
-    def weekday_short(d: date) -> str:
-        """Return readable label for an ISO week (Monday → Sunday)."""
-        names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        return names[d.weekday()]
-
     def week_range_label(y: int, w: int) -> str:
         # ISO week starts Monday = 1
         mon = date.fromisocalendar(y, w, 1)
         sun = mon + timedelta(days=6)
         return f"{y}-W{w:02d} ({mon.isoformat()} → {sun.isoformat()})"
 
-    # Step 1: Collect all valid dates and determine available weeks
+    # Step 1: Bucket events by ISO week and weekday (one pass) and determine available weeks.
+    # Parsed date and week are precomputed per event ("_day"/"_week", see build_indexes).
+    # Selected events are in chronological order, so every day column is already sorted.
+    # One column per day, indexed by date.weekday() (Mon = 0 ... Sat = 5; Sunday is not shown).
 
-    dates: list[date] = []
+    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+    by_week: dict[tuple[int, int], list[list[dict[str, Any]]]] = {}
     for ev in events:
-        dd = parse_date(_safe_str(ev.get("date")))
-        if dd:
-            dates.append(dd)
-
-    if not dates:
+        wk = ev["_week"]
+        if wk is None:
+            continue
+        day_cols = by_week.get(wk)
+        if day_cols is None:
+            day_cols = by_week[wk] = [[] for _ in days]
+        wd = ev["_day"].weekday()
+        if wd < len(days):
+            day_cols[wd].append(ev)
+
+    if not by_week:
         _println("No valid event dates.")
         return
 
-    weeks = sorted({week_key(d) for d in dates})
+    weeks = sorted(by_week)
+
+    # Highlight style: rich markup inside the table, '!' prefix in the plain fallback.
+    # It is fixed for the whole run, so it is chosen once and not per event.
+    mark_conflict = "[red]{}[/]".format if HAS_RICH else "! {}".format
+
+    # Conflicts per week, computed once: the events cannot change while this flow runs,
+    # so re-showing the week list or a week reuses them. Conflicts only happen on the
+    # same date, so one pass over all events is bucketed by the week of that date.
+    week_conflicts: dict[tuple[int, int], list[tuple[dict[str, Any], dict[str, Any]]]] = {
+        yw: [] for yw in by_week
+    }
+    for a, b in find_conflicts(events):
+        wk = a["_week"]
+        if wk is not None and b["_week"] is not None:
+            week_conflicts[wk].append((a, b))
 
     # Step 2: Main loop – allow inspecting multiple weeks
 
@@ -1128,20 +1421,9 @@ def _flow_timetable_week(events: list[dict[str, Any]]) -> None:
 
         _println("\nAvailable weeks:")
 
-        # Precompute conflicts per week (for display)
-        week_conf_count: dict[tuple[int, int], int] = {}
-        for yw in weeks:
-            yy, ww = yw
-            wk_events = []
-            for ev in events:
-                dd = parse_date(_safe_str(ev.get("date")))
-                if dd and week_key(dd) == (yy, ww):
-                    wk_events.append(ev)
-            week_conf_count[yw] = len(find_conflicts(wk_events))
-
         for i, (y, w) in enumerate(weeks, start=1):
             label = week_range_label(y, w)
-            nconf = week_conf_count.get((y, w), 0)
+            nconf = len(week_conflicts[y, w])
 
             if HAS_RICH:
                 conf_txt = f"[red]{nconf} conflicts[/]" if nconf > 0 else "[green]0 conflicts[/]"
@@ -1158,58 +1440,21 @@ def _flow_timetable_week(events: list[dict[str, Any]]) -> None:
         else:
             y, w = weeks[0]
 
-        # Step 3: Filter events for the selected week
+        # Step 3: Day columns of the selected week (bucketed in step 1)
 
-        week_events: list[dict[str, Any]] = []
-        for ev in events:
-            dd = parse_date(_safe_str(ev.get("date")))
-            if dd and week_key(dd) == (y, w):
-                week_events.append(ev)
-
-        if not week_events:
-            _println("No events in that week.")
-            continue
-
-        # Step 4: Detect conflicts inside this week
+        day_cols = by_week[y, w]
 
-        conf_pairs = find_conflicts(week_events)
+        # Step 4: Conflicts inside this week
 
-        def event_key(ev: dict[str, Any]) -> tuple[str, str, str, str]:
-            """
-            Stable event identifier for conflict marking.
-            Avoids relying on event_id which may not exist everywhere.
-            """
-            return (
-                _safe_str(ev.get("date")),
-                _safe_str(ev.get("start")),
-                _safe_str(ev.get("end")),
-                _safe_str(ev.get("course_id")),
-            )
+        conf_pairs = week_conflicts[y, w]
 
-        conflict_keys: set[tuple[str, str, str, str]] = set()
-        for a, b in conf_pairs:
-            conflict_keys.add(event_key(a))
-            conflict_keys.add(event_key(b))
+        # find_conflicts returns the event dicts themselves, so identity marks them
+        conflict_ids = {id(ev) for pair in conf_pairs for ev in pair}
 
-        def fmt_event(ev: dict[str, Any], rich: bool) -> str:
+        def fmt_event(ev: dict[str, Any]) -> str:
             """Format event line and highlight if it is part of a conflict."""
             txt = _event_line(ev)
-            if event_key(ev) in conflict_keys:
-                if rich and HAS_RICH:
-                    return f"[red]{txt}[/]"
-                return f"! {txt}"  # plain fallback
-            return txt
-
-        # Step 5: Bucket events by weekday for table layout
-
-        buckets = {name: [] for name in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]}
-        for ev in sorted(week_events, key=lambda x: (_safe_str(x.get("date")), _safe_str(x.get("start")))):
-            dd = parse_date(_safe_str(ev.get("date")))
-            if not dd:
-                continue
-            wd = weekday_short(dd)
-            if wd in buckets:
-                buckets[wd].append(ev)
+            return mark_conflict(txt) if id(ev) in conflict_ids else txt
 
         # header with date range
         mon = date.fromisocalendar(y, w, 1)
@@ -1217,46 +1462,38 @@ def _flow_timetable_week(events: list[dict[str, Any]]) -> None:
         _println(f"\n=== Timetable {y}-W{w:02d} ({mon.isoformat()} → {sun.isoformat()}) ===")
 
         # legend (only if conflicts exist)
-        if conflict_keys:
+        if conflict_ids:
             if HAS_RICH:
                 _println("Legend: [red]CONFLICT[/] = overlaps detected in this week")
             else:
                 _println("Legend: ! = conflict (overlap)")
 
-        # Step 6: Render timetable (rich table or plain fallback)
+        # Step 5: Render timetable (rich table or plain fallback)
 
         if HAS_RICH:
             table = Table(box=box.SIMPLE)  # type: ignore
-            for day in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]:
+            for day in days:
                 table.add_column(day)
 
-            def day_cell(day: str) -> str:
-                if not buckets[day]:
-                    return ""
-                # blank line between events for readability
-                return "\n\n".join(fmt_event(ev, rich=True) for ev in buckets[day])
-
-            table.add_row(*(day_cell(d) for d in ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]))
+            # blank line between events for readability (empty day -> empty cell)
+            table.add_row(*("\n\n".join(fmt_event(ev) for ev in col) for col in day_cols))
             console.print(table)  # type: ignore
 
         else:
-            cols = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
             col_width = 38
-            header = " | ".join([c.ljust(col_width) for c in cols])
-            _println(header)
-            _println("-" * len(header))
-
-            def day_cell_plain(day: str) -> str:
-                if not buckets[day]:
-                    return ""
-                return "\n\n".join(fmt_event(ev, rich=False) for ev in buckets[day])
+            header = " | ".join([c.ljust(col_width) for c in days])
 
-            row = []
-            for c in cols:
-                txt = day_cell_plain(c)
-                row.append(txt[:col_width].ljust(col_width))
+            # One column of fixed-width lines per day (one line per event), laid out
+            # row by row; shorter days are padded with blank cells
+            columns = [
+                [fmt_event(ev)[:col_width].ljust(col_width) for ev in col] for col in day_cols
+            ]
+            blank = " " * col_width
+            rows = [" | ".join(row) for row in zip_longest(*columns, fillvalue=blank)]
+            if not rows:
+                rows = [" | ".join([blank] * len(days))]
 
-            _println(" | ".join(row))
+            _println_lines([header, "-" * len(header), *rows])
 
         # flow control
         after = _prompt("\nPress Enter to choose another week, or 0 to return to menu: ").strip()
@@ -1322,22 +1559,22 @@ def _flow_export(events: list[dict[str, Any]]) -> None:
         out_path = out_path.with_suffix(".ics")
 
     # --- Deduplicate events (avoid double exports) ---
-    seen: set[str] = set()
-    unique: list[dict[str, Any]] = []
-    for ev in events:
-        key = _safe_str(ev.get("event_id")).strip()
-        if not key:
-            key = (
-                f"{_safe_str(ev.get('course_id'))}|{_safe_str(ev.get('date'))}|"
-                f"{_safe_str(ev.get('start'))}|{_safe_str(ev.get('end'))}"
-            )
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(ev)
-    events = unique
+    def unique_events() -> Iterator[dict[str, Any]]:
+        """Yield events in order, skipping repeats (lazily, no second list)."""
+        seen: set[str] = set()
+        for ev in events:
+            key = _safe_str(ev.get("event_id")).strip()
+            if not key:
+                key = (
+                    f"{_safe_str(ev.get('course_id'))}|{_safe_str(ev.get('date'))}|"
+                    f"{_safe_str(ev.get('start'))}|{_safe_str(ev.get('end'))}"
+                )
+            if key in seen:
+                continue
+            seen.add(key)
+            yield ev
 
-    n = export_events_to_ics(events, out_path)
+    n = export_events_to_ics(unique_events(), out_path)
     abs_path = out_path.resolve()
 
     _println(f"\nExported {n} events.")
@@ -1354,9 +1591,20 @@ def _flow_export(events: list[dict[str, Any]]) -> None:
     if open_now != "n":
         try:
             if sys.platform.startswith("win"):
-                subprocess.run(["explorer.exe", "/select,", str(abs_path)], check=False)
+                # Shell call, no explorer.exe process to start and wait for
+                os.startfile(abs_path.parent)  # type: ignore[attr-defined]
             else:
-                subprocess.run(["open" if sys.platform == "darwin" else "xdg-open", str(abs_path.parent)], check=False)
+                import subprocess
+
+                # Started detached and not waited for: the file manager may keep running
+                # (or print to the terminal) long after the folder is shown
+                subprocess.Popen(
+                    ["open" if sys.platform == "darwin" else "xdg-open", str(abs_path.parent)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
         except Exception:
             pass
 
@@ -1366,8 +1614,8 @@ def _flow_export(events: list[dict[str, Any]]) -> None:
 
 def _flow_update_data() -> bool:
     """
-    Runs scrape + parse as subprocesses using the current venv Python.
-    Streams output live. Writes metadata.json afterwards.
+    Runs scrape + parse (in this process, or as subprocesses using the current venv
+    Python if MYSCHEDULE_SUBPROCESS=1). Streams output live. Writes metadata.json afterwards.
 
     UX improvements:
     - 0 = back at each step
@@ -1418,24 +1666,21 @@ def _flow_update_data() -> bool:
 
     # Run scraper
     _println("\nRunning scraper... (Ctrl+C to abort)")
-    ok = _run_scrape_subprocess(semester=semester, refresh=refresh)
+    ok = _run_scrape(semester=semester, refresh=refresh)
     if not ok:
         _println("Scrape failed or was aborted. Update cancelled (processed data not rebuilt).")
         return False
 
     # Run parser
     _println("\nRunning parser... (Ctrl+C to abort)")
-    ok = _run_parse_subprocess()
-    if not ok:
+    counts = _run_parse()
+    if counts is None:
         _println("Parse failed or was aborted. Processed JSON may be incomplete.")
         return False
 
-    # After parse, count courses/events and write metadata
+    # After parse, write metadata with the course/event counts
     try:
-        courses = _load_json(PROCESSED_DIR / "courses.json")
-        events = _load_json(PROCESSED_DIR / "events.json")
-        c_count = len(courses) if isinstance(courses, list) else 0
-        e_count = len(events) if isinstance(events, list) else 0
+        c_count, e_count = counts
         _write_metadata(semester=semester, courses_count=c_count, events_count=e_count)
         _println(f"\nUpdate done. courses={c_count} events={e_count}")
     except Exception as e:
@@ -1449,6 +1694,179 @@ def _flow_update_data() -> bool:
 # =========================
 
 
+# Scraper output lines that drive the progress bar: "Found N courses" (group 1 = N)
+# sets the total, every "FETCH <id>" / "SKIP <id>" line is one course done
+_SCRAPE_PROGRESS_RE = re.compile(r"Found (\d+) courses|FETCH |SKIP")
+
+# Minimum time between two prints of scraper output while the progress bar is live (seconds)
+_SCRAPE_PRINT_INTERVAL = 0.05
+
+
+def _verbose_update() -> bool:
+    """
+    True if every scraper line should be shown next to the progress bar (MYSCHEDULE_VERBOSE=1).
+    """
+    return os.environ.get("MYSCHEDULE_VERBOSE") == "1"
+
+
+def _use_subprocess() -> bool:
+    """
+    True if scrape/parse should run as child processes (MYSCHEDULE_SUBPROCESS=1).
+
+    By default both run inside this process: no second interpreter start, no
+    re-import of the package and no pipe in between.
+    """
+    return os.environ.get("MYSCHEDULE_SUBPROCESS") == "1"
+
+
+class _ScrapeOutput:
+    """
+    Shows the scraper's output lines and drives the progress display from them.
+
+    Lines come either from the in-process scraper (feed is its log function) or
+    from the scraper subprocess' stdout. Use as a context manager: the Rich
+    progress bar is live inside the with block.
+
+    With the progress bar, the per-course FETCH/SKIP lines are only printed if
+    verbose (the bar already shows them); all other lines are always printed.
+    Without Rich every line is printed.
+    """
+
+    def __init__(self, verbose: bool = False) -> None:
+        self.verbose = verbose
+        self.total: Optional[int] = None
+        self.done = 0
+        self.progress: Any = None
+        self.task: Any = None
+        self.pending: list[str] = []
+        self.last_print = 0.0
+        self.last_line = 0.0
+
+        if HAS_RICH:
+            from rich.progress import Progress, BarColumn, TimeRemainingColumn, TextColumn
+
+            self.progress = Progress(  # type: ignore
+                TextColumn("[progress.description]{task.description}"),  # type: ignore
+                BarColumn(),  # type: ignore
+                TextColumn("{task.completed}/{task.total}"),  # type: ignore
+                TimeRemainingColumn(),  # type: ignore
+                console=console,
+            )
+            self.task = self.progress.add_task("Scraping...", total=1)
+
+    def __enter__(self) -> "_ScrapeOutput":
+        if self.progress is not None:
+            self.progress.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
+        if self.progress is not None:
+            self.progress.stop()
+
+    def feed(self, line: str) -> None:
+        """
+        Handle one output line (without trailing newline).
+        """
+        m = _SCRAPE_PROGRESS_RE.match(line)
+        if m:
+            if m.group(1) is not None:
+                # Detect total number of courses
+                self.total = int(m.group(1))
+                if self.progress is not None:
+                    self.progress.update(self.task, total=self.total, completed=0)
+            else:
+                # Each course = one progress step
+                self.done += 1
+                if self.progress is not None:
+                    self.progress.update(self.task, completed=self.done)
+                    if not self.verbose:
+                        return
+                elif self.total:
+                    line = f"[{self.done}/{self.total}] {line}"
+
+        if self.progress is None:
+            _println(line)
+            return
+
+        # Every print redraws the live progress bar, so bursts of SKIP lines (cached
+        # pages, no work in between) are printed in batches. A line is never held back
+        # while the scraper may be busy: any other line (FETCH is followed by a
+        # download; status and error lines) flushes the batch together with itself, as
+        # does a line arriving after a pause. The rest is printed on exit.
+        self.pending.append(line)
+        now = monotonic()
+        if (
+            not line.startswith("SKIP")
+            or now - self.last_line >= _SCRAPE_PRINT_INTERVAL
+            or now - self.last_print >= _SCRAPE_PRINT_INTERVAL
+        ):
+            self.flush()
+            self.last_print = now
+        self.last_line = now
+
+    def flush(self) -> None:
+        """Print lines still waiting in the batch."""
+        _println_lines(self.pending)
+        self.pending.clear()
+
+
+def _run_scrape(semester: str, refresh: bool) -> bool:
+    """
+    Scrape the given semester into the raw HTML cache, showing live progress.
+
+    Returns True on success. Errors are printed and return False; Ctrl+C
+    aborts cleanly and returns False as well.
+    """
+    if _use_subprocess():
+        return _run_scrape_subprocess(semester=semester, refresh=refresh)
+
+    try:
+        from myschedule.scrape import scrape_semester
+
+        with _ScrapeOutput(verbose=_verbose_update()) as out:
+            scrape_semester(semester, refresh=refresh, log=out.feed)
+        return True
+    except KeyboardInterrupt:
+        _println("\nAborted by user (Ctrl+C). Scraper stopped.")
+        return False
+    except Exception as e:
+        _println(f"Scraper failed: {e}")
+        return False
+
+
+def _run_parse() -> Optional[tuple[int, int]]:
+    """
+    Parse the raw HTML cache into courses.json/events.json.
+
+    Returns the number of courses and events written on success. Errors are
+    printed and return None; Ctrl+C aborts and returns None as well.
+    """
+    if _use_subprocess():
+        if not _run_parse_subprocess():
+            return None
+        # The subprocess only reports through its output: count from the written files
+        courses = _load_json(PROCESSED_DIR / "courses.json")
+        events = _load_json(PROCESSED_DIR / "events.json")
+        return (
+            len(courses) if isinstance(courses, list) else 0,
+            len(events) if isinstance(events, list) else 0,
+        )
+
+    try:
+        from myschedule.parse import parse_all
+
+        counts = parse_all(raw_dir=RAW_DIR, out_dir=PROCESSED_DIR, log=_println)
+        _println(f"Parsing finished. JSON written to {PROCESSED_DIR.resolve()}")
+        return counts
+    except KeyboardInterrupt:
+        _println("\nAborted by user (Ctrl+C). Parser stopped.")
+        return None
+    except Exception as e:
+        _println(f"Parser failed: {e}")
+        return None
+
+
 def _run_scrape_subprocess(semester: str, refresh: bool) -> bool:
     """
     Runs: python -u -m myschedule.scrape --semester FS26 --refresh
@@ -1458,6 +1876,8 @@ def _run_scrape_subprocess(semester: str, refresh: bool) -> bool:
     - terminates scraper process
     - returns False to caller
     """
+    import subprocess
+
     cmd = [sys.executable, "-u", "-m", "myschedule.scrape", "--semester", semester]
     if refresh:
         cmd.append("--refresh")
@@ -1472,59 +1892,15 @@ def _run_scrape_subprocess(semester: str, refresh: bool) -> bool:
         bufsize=1,
     )
 
-    total: Optional[int] = None
-    done = 0
-
     try:
-        if HAS_RICH:
-            progress = Progress(  # type: ignore
-                TextColumn("[progress.description]{task.description}"),  # type: ignore
-                BarColumn(),  # type: ignore
-                TextColumn("{task.completed}/{task.total}"),  # type: ignore
-                TimeRemainingColumn(),  # type: ignore
-                console=console,
-            )
-
-            task = progress.add_task("Scraping...", total=1)
-
-            with progress:
-                assert proc.stdout is not None
-                for line in proc.stdout:
-                    line = line.rstrip("\n")
-
-                    # Detect total number of courses
-                    if line.startswith("Found ") and " courses" in line:
-                        try:
-                            total = int(line.split("Found ")[1].split(" courses")[0].strip())
-                            progress.update(task, total=total, completed=0)
-                        except Exception:
-                            pass
-
-                    # Each course = one progress step
-                    if line.startswith("FETCH ") or line.startswith("SKIP"):
-                        done += 1
-                        progress.update(task, completed=done)
-
-                    console.print(line)  # type: ignore
-
-                rc = proc.wait()
-                return rc == 0
-
-        else:
+        with _ScrapeOutput(verbose=_verbose_update()) as out:
             assert proc.stdout is not None
+            feed = out.feed
             for line in proc.stdout:
-                line = line.rstrip("\n")
-                if line.startswith("FETCH ") or line.startswith("SKIP"):
-                    done += 1
-                    if total:
-                        _println(f"[{done}/{total}] {line}")
-                    else:
-                        _println(line)
-                else:
-                    _println(line)
-
-            rc = proc.wait()
-            return rc == 0
+                feed(line.rstrip("\n"))
+
+        rc = proc.wait()
+        return rc == 0
 
     except KeyboardInterrupt:
         _println("\nAborted by user (Ctrl+C). Stopping scraper...")
@@ -1541,6 +1917,8 @@ def _run_parse_subprocess() -> bool:
 
     Returns True on exit code 0, else False. Ctrl+C stops the parser process.
     """
+    import subprocess
+
     cmd = [sys.executable, "-u", "-m", "myschedule.parse"]
     proc = subprocess.Popen(
         cmd,
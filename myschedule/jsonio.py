@@ -0,0 +1,53 @@
+"""
+JSON reading/writing with an optional fast backend.
+
+If orjson is installed (pip install myschedule[fast]), it is used for parsing and
+serializing; otherwise the stdlib json module is used. Both backends produce the
+same Python objects and the same pretty-printed output, so callers don't care.
+
+Files are handled as raw bytes: orjson parses UTF-8 bytes directly, which avoids
+decoding the file into a str first.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from types import ModuleType
+from typing import Any, Optional
+
+# Imported by name so the module type-checks the same with and without orjson installed
+orjson: Optional[ModuleType]
+try:
+    orjson = importlib.import_module("orjson")
+except ImportError:  # optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes) -> object:
+    """
+    Parse a JSON document given as UTF-8 bytes.
+
+    Returns whatever the document contains (dict, list, str, ...); callers check the type.
+
+    Raises JSONDecodeError for invalid JSON and UnicodeDecodeError for invalid UTF-8
+    (orjson reports both as JSONDecodeError).
+    """
+    parsed: object
+    if orjson is not None:
+        parsed = orjson.loads(data)
+    else:
+        parsed = json.loads(data.decode("utf-8"))
+    return parsed
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """
+    Serialize obj as UTF-8 JSON indented by 2 spaces (non-ASCII characters kept as-is).
+    """
+    if orjson is not None:
+        return bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
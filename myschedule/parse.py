@@ -15,16 +15,16 @@ Important rules (DO NOT CHANGE):
 
 from __future__ import annotations
 
-import json
-
 from pathlib import Path
 
 from datetime import datetime
 
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+from myschedule import jsonio
+
 import argparse
 
 
@@ -219,9 +219,13 @@ def parse_course_html(
 def parse_all(
     raw_dir: Path = PACKAGE_DIR / "data" / "raw",
     out_dir: Path = PACKAGE_DIR / "data" / "processed",
-) -> None:
+    log: Callable[[str], None] = print,
+) -> Tuple[int, int]:
     """
     Parses all cached HTML files and writes the final JSON output.
+
+    Info lines go to `log` (stdout by default).
+    Returns the number of courses and events written.
     """
 
     # Resolve absolute paths
@@ -231,8 +235,8 @@ def parse_all(
     # Make sure output directory exists
     out_path.mkdir(parents=True, exist_ok=True)
 
-    print("RAW_DIR :", raw_path)
-    print("FILES   :", [p.name for p in raw_path.glob("*.html")])
+    log(f"RAW_DIR : {raw_path}")
+    log(f"FILES   : {[p.name for p in raw_path.glob('*.html')]}")
 
     courses: List[Dict] = []
     events: List[Dict] = []
@@ -256,16 +260,12 @@ def parse_all(
         events.extend(course_events)
 
     # Write courses JSON file
-    (out_path / "courses.json").write_text(
-        json.dumps(courses, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    (out_path / "courses.json").write_bytes(jsonio.dumps_pretty(courses))
 
     # Write events JSON file
-    (out_path / "events.json").write_text(
-        json.dumps(events, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    (out_path / "events.json").write_bytes(jsonio.dumps_pretty(events))
+
+    return len(courses), len(events)
 
 
 # ---------------------------------------------------------------------------
@@ -2,7 +2,7 @@ from __future__ import annotations
 import argparse
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup
@@ -80,20 +80,24 @@ def scrape_semester(
     semester: str,
     refresh: bool = False,
     sleep_seconds: float = 0.2,
+    log: Callable[[str], None] = print,
 ) -> None:
     """
     Scrape all course detail pages for one semester and cache them as HTML.
+
+    Progress lines ("Found N courses", "SKIP  <id>", "FETCH <id>") go to `log`
+    (stdout by default, the interactive mode passes its own handler).
     """
 
     # Make sure the raw data directory exists
     RAW_DIR.mkdir(parents=True, exist_ok=True)
 
-    print(f"Scraping semester: {semester}")
+    log(f"Scraping semester: {semester}")
 
     # Fetch all course links for the given semester
     courses = _fetch_course_links(semester)
 
-    print(f"Found {len(courses)} courses")
+    log(f"Found {len(courses)} courses")
 
     # Loop over all courses
     for course_id, url in courses:
@@ -102,10 +106,10 @@ def scrape_semester(
 
         # Skip download if file already exists and refresh is not enabled
         if out_file.exists() and not refresh:
-            print(f"SKIP  {course_id}")
+            log(f"SKIP  {course_id}")
             continue
 
-        print(f"FETCH {course_id}")
+        log(f"FETCH {course_id}")
 
         # Download the course detail page
         resp = requests.get(url, timeout=30)
@@ -117,7 +121,7 @@ def scrape_semester(
         # Sleep a bit to avoid sending too many requests at once
         time.sleep(sleep_seconds)
 
-    print("Scraping finished.")
+    log("Scraping finished.")
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,102 @@
+"""
+Course search helpers shared by the CLI and the interactive UI.
+
+A course matches a search query if the (lowercased) query is a substring of the
+course's "haystack": course_id, title and instructor names joined into one
+lowercased string.
+
+Haystacks only depend on the course data, so they are built once together with
+the other indexes instead of on every search.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+
+def course_haystack(course: dict[str, Any]) -> str:
+    """
+    Build the lowercased search text of one course (course_id, title, instructors).
+    """
+    cid = str(course.get("course_id", "") or "").strip().upper()
+    title = str(course.get("title", "") or "").strip()
+    instructors = course.get("instructors", [])
+    if isinstance(instructors, list):
+        instr_text = " ".join("" if x is None else str(x) for x in instructors)
+    else:
+        instr_text = str(instructors or "")
+    return f"{cid} {title} {instr_text}".lower()
+
+
+@dataclass
+class SearchIndex:
+    """
+    Substring search over a fixed list of haystacks (one per course, same order).
+
+    - haystacks: lowercased search text per row (see course_haystack)
+    - bigrams: 2-character window -> ascending positions of rows containing it
+    - trigrams: 3-character window -> ascending positions of rows containing it
+
+    A row can only contain the query if it contains every 2/3-character window of it,
+    so the posting lists narrow the rows down before the real substring check.
+    """
+
+    haystacks: list[str]
+    bigrams: dict[str, list[int]]
+    trigrams: dict[str, list[int]]
+
+
+def _ngram_postings(haystacks: list[str], n: int) -> dict[str, list[int]]:
+    """
+    Map every n-character window to the ascending positions of rows containing it.
+    """
+    postings: dict[str, list[int]] = {}
+    for row, hay in enumerate(haystacks):
+        # set(): each row is listed at most once per window; rows are visited in
+        # order, so every posting list stays sorted
+        for gram in {hay[i : i + n] for i in range(len(hay) - n + 1)}:
+            postings.setdefault(gram, []).append(row)
+    return postings
+
+
+def build_search_index(haystacks: list[str]) -> SearchIndex:
+    """
+    Build the bigram and trigram postings for the given haystacks.
+    """
+    return SearchIndex(
+        haystacks=haystacks,
+        bigrams=_ngram_postings(haystacks, 2),
+        trigrams=_ngram_postings(haystacks, 3),
+    )
+
+
+def _candidate_rows(index: SearchIndex, query: str) -> Iterable[int]:
+    """
+    Return the ascending row positions that may contain `query`.
+    """
+    if len(query) < 2:
+        return range(len(index.haystacks))
+    if len(query) == 2:
+        return index.bigrams.get(query, ())
+
+    # Intersect the posting lists of the two rarest trigrams of the query.
+    # Intersecting all of them would not pay off: the substring check verifies the rest.
+    postings = sorted(
+        (index.trigrams.get(query[i : i + 3], ()) for i in range(len(query) - 2)),
+        key=len,
+    )
+    if len(postings) == 1 or not postings[0]:
+        return postings[0]
+    second = set(postings[1])
+    return [row for row in postings[0] if row in second]
+
+
+def iter_matches(index: SearchIndex, query: str) -> Iterator[int]:
+    """
+    Yield the positions of all rows whose haystack contains `query` (lowercased), in order.
+    """
+    haystacks = index.haystacks
+    for row in _candidate_rows(index, query):
+        if query in haystacks[row]:
+            yield row
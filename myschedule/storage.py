@@ -15,10 +15,19 @@ from repeated scraping and parsing operations.
 
 from __future__ import annotations
 
-import json
+import os
+import sys
 from pathlib import Path
 from typing import Iterable
 
+from myschedule import jsonio
+
+# Last loaded selection per file: path -> ((mtime_ns, size), ids).
+# The interactive menu checks the selection at the top of every turn (to pick up
+# changes made with `myschedule add/remove` meanwhile); as long as the file is
+# unchanged, the cached ids are returned instead of re-reading the JSON.
+_LOAD_CACHE: dict[Path, tuple[tuple[int, int], frozenset[str]]] = {}
+
 
 def _default_selected_path() -> Path:
     """
@@ -42,29 +51,52 @@ def load_selected_course_ids(path: str | Path | None = None) -> set[str]:
 
     This function is deliberately defensive:
     it never crashes the application if the file is missing or corrupted.
+
+    Repeated loads of an unchanged file (same mtime and size) are served from memory.
     """
     # Use custom path if provided (mainly for tests),
     # otherwise fall back to the default package location
     selected_path = Path(path) if path is not None else _default_selected_path()
 
     # First run: file does not exist yet → no courses selected
-    if not selected_path.exists():
+    try:
+        st = os.stat(selected_path)
+    except OSError:
+        _LOAD_CACHE.pop(selected_path, None)
         return set()
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _LOAD_CACHE.get(selected_path)
+    if cached is not None and cached[0] == stamp:
+        # always hand out a fresh set: callers add/remove in place
+        return set(cached[1])
+
+    ids = _read_selected_course_ids(selected_path)
+    _LOAD_CACHE[selected_path] = (stamp, frozenset(ids))
+    return ids
+
+
+def _read_selected_course_ids(selected_path: Path) -> set[str]:
+    """
+    Read and normalize the IDs stored in selected_path (empty set if invalid).
+    """
     try:
-        data = json.loads(selected_path.read_text(encoding="utf-8"))
+        data = jsonio.loads(selected_path.read_bytes())
+        if not isinstance(data, dict):
+            return set()
         ids = data.get("selected_course_ids", [])
         if not isinstance(ids, list):
             return set()
-        # normalize: strip + uppercase, ignore non-strings
+        # normalize: strip + uppercase, ignore non-strings.
+        # Interned like the course ids of the loaded indexes, so lookups compare identical strings.
         out: set[str] = set()
         for x in ids:
             if isinstance(x, str):
                 cid = x.strip().upper()
                 if cid:
-                    out.add(cid)
+                    out.add(sys.intern(cid))
         return out
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError, AttributeError):
+    except (OSError, jsonio.JSONDecodeError, UnicodeDecodeError):
         return set()
 
 
@@ -75,6 +107,9 @@ def save_selected_course_ids(ids: Iterable[str], path: str | Path | None = None)
     Creates parent directories if needed.
 
     All IDs are normalized before saving to guarantee a stable file format.
+
+    The file is written to a temporary sibling and then renamed over the old one,
+    so an interrupted save never leaves a truncated selection behind.
     """
     selected_path = Path(path) if path is not None else _default_selected_path()
     selected_path.parent.mkdir(parents=True, exist_ok=True)
@@ -82,4 +117,8 @@ def save_selected_course_ids(ids: Iterable[str], path: str | Path | None = None)
     norm = sorted({str(x).strip().upper() for x in ids if str(x).strip()})
     payload = {"selected_course_ids": norm}
 
-    selected_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path = selected_path.with_name(selected_path.name + ".tmp")
+    tmp_path.write_bytes(jsonio.dumps_pretty(payload))
+    os.replace(tmp_path, selected_path)
+    # The next load re-reads the file we just wrote
+    _LOAD_CACHE.pop(selected_path, None)
@@ -42,6 +42,10 @@ setup(
     author="Robert Puselja / Nikolas Kehrer",
     packages=find_packages(exclude=("tests", ".github")),
     install_requires=read_requirements("requirements.txt"),
-    extras_require={"dev": read_requirements("requirements-dev.txt")},
+    extras_require={
+        "dev": read_requirements("requirements-dev.txt"),
+        # optional faster JSON backend, see myschedule/jsonio.py
+        "fast": ["orjson"],
+    },
     entry_points={"console_scripts": ["myschedule=myschedule.cli:main"]},
 )
@@ -8,7 +8,7 @@ Definition used here:
 
 import unittest
 
-from myschedule.conflicts import find_conflicts
+from myschedule.conflicts import _time_to_minutes, find_conflicts
 
 
 class TestConflicts(unittest.TestCase):
@@ -37,6 +37,30 @@ class TestConflicts(unittest.TestCase):
         confs = find_conflicts(events)
         self.assertEqual(len(confs), 0)
 
+    def test_long_event_overlaps_all_later_ones(self) -> None:
+        # a block event spanning the whole morning overlaps every lecture inside it,
+        # even after a shorter event in between has already ended
+        events = [
+            {"date": "2026-02-19", "start": "08:00", "end": "12:00", "course_id": "BLOCK"},
+            {"date": "2026-02-19", "start": "08:15", "end": "09:00", "course_id": "A"},
+            {"date": "2026-02-19", "start": "10:15", "end": "11:00", "course_id": "B"},
+            {"date": "2026-02-20", "start": "10:15", "end": "11:00", "course_id": "C"},
+        ]
+        confs = find_conflicts(events)
+        pairs = sorted((a["course_id"], b["course_id"]) for a, b in confs)
+        self.assertEqual(pairs, [("BLOCK", "A"), ("BLOCK", "B")])
+
+    def test_time_to_minutes(self) -> None:
+        self.assertEqual(_time_to_minutes("00:00"), 0)
+        self.assertEqual(_time_to_minutes("08:15"), 495)
+        self.assertEqual(_time_to_minutes("23:59"), 1439)
+        # non-padded / whitespace forms still go through the general parser
+        self.assertEqual(_time_to_minutes("8:15"), 495)
+        self.assertEqual(_time_to_minutes(" 08:15 "), 495)
+        for bad in ("24:00", "12:60", "1a:00", "12-00", "", "12:00:00"):
+            with self.assertRaises(ValueError):
+                _time_to_minutes(bad)
+
 
 if __name__ == "__main__":
     unittest.main()
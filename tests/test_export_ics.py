@@ -6,13 +6,14 @@ The export must:
 - Contain a VCALENDAR wrapper
 - Contain at least one VEVENT entry
 - Include a readable SUMMARY field
+- Never leave a truncated file behind if it fails halfway
 """
 
 import tempfile
 import unittest
 from pathlib import Path
 
-from myschedule.export_ics import export_events_to_ics
+from myschedule.export_ics import _ics_escape, export_events_to_ics
 
 
 class TestExportICS(unittest.TestCase):
@@ -40,6 +41,51 @@ class TestExportICS(unittest.TestCase):
             self.assertIn("BEGIN:VEVENT", text)
             self.assertIn("SUMMARY:FS261110 Public Economics", text)
 
+    def test_export_formats_times_and_skips_invalid_dates(self) -> None:
+        events = [
+            {
+                "course_id": "A",
+                "title": "Valid",
+                "date": "2026-02-19",
+                "start": "10:15",
+                "end": "12:00",
+            },
+            {
+                "course_id": "B",
+                "title": "Invalid",
+                "date": "2026-02-30",
+                "start": "10:15",
+                "end": "12:00",
+            },
+        ]
+
+        with tempfile.TemporaryDirectory() as d:
+            out = Path(d) / "out.ics"
+            n = export_events_to_ics(events, out)
+            self.assertEqual(n, 1)
+            text = out.read_text(encoding="utf-8")
+            self.assertIn("DTSTART:20260219T101500", text)
+            self.assertIn("DTEND:20260219T120000", text)
+            self.assertNotIn("Invalid", text)
+
+    def test_failed_export_keeps_previous_file(self) -> None:
+        def events():
+            yield {"course_id": "A", "date": "2026-02-19", "start": "10:15", "end": "12:00"}
+            raise RuntimeError("boom")
+
+        with tempfile.TemporaryDirectory() as d:
+            out = Path(d) / "out.ics"
+            out.write_text("previous", encoding="utf-8")
+            with self.assertRaises(RuntimeError):
+                export_events_to_ics(events(), out)
+            self.assertEqual(out.read_text(encoding="utf-8"), "previous")
+            self.assertEqual([p.name for p in Path(d).iterdir()], ["out.ics"])
+
+    def test_ics_escape_special_characters(self) -> None:
+        self.assertEqual(_ics_escape("a,b;c\\d"), "a\\,b\\;c\\\\d")
+        # CRLF and LF both become one escaped newline
+        self.assertEqual(_ics_escape("line1\r\nline2\nline3"), "line1\\nline2\\nline3")
+
 
 if __name__ == "__main__":
     unittest.main()
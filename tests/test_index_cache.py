@@ -0,0 +1,53 @@
+"""
+Tests for the pickle sidecar cache of built indexes.
+
+Cache contract:
+- First call builds and writes the cache
+- Unchanged source files -> cached value is returned (no rebuild)
+- Changed or missing source files -> value is rebuilt
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from myschedule.index_cache import load_or_build
+
+
+class TestIndexCache(unittest.TestCase):
+    def test_cache_hit_skips_build(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            src = Path(d) / "events.json"
+            src.write_text("[]", encoding="utf-8")
+            cache = Path(d) / ".index.pkl"
+            calls: list[int] = []
+
+            def build() -> dict[str, int]:
+                calls.append(1)
+                return {"n": len(calls)}
+
+            self.assertEqual(load_or_build(cache, [src], build), {"n": 1})
+            self.assertEqual(load_or_build(cache, [src], build), {"n": 1})
+            self.assertEqual(len(calls), 1)
+
+    def test_changed_source_rebuilds(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            src = Path(d) / "events.json"
+            src.write_text("[]", encoding="utf-8")
+            cache = Path(d) / ".index.pkl"
+
+            self.assertEqual(load_or_build(cache, [src], lambda: "old"), "old")
+            # different size -> different stamp, even if mtime resolution is coarse
+            src.write_text("[1, 2]", encoding="utf-8")
+            self.assertEqual(load_or_build(cache, [src], lambda: "new"), "new")
+
+    def test_missing_source_is_not_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            src = Path(d) / "missing.json"
+            cache = Path(d) / ".index.pkl"
+            self.assertEqual(load_or_build(cache, [src], lambda: []), [])
+            self.assertFalse(cache.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
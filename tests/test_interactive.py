@@ -0,0 +1,93 @@
+"""
+Unit tests for the index/selection helpers of the interactive mode.
+
+Contract:
+- Conflict preview returns (candidate_event, selected_event) pairs, same overlap
+  rule as find_conflicts (touching endpoints is NOT a conflict)
+- SelectedState.add/remove keep the event list identical to a fresh rebuild
+- build_indexes reloads unchanged data from its pickle cache, with a new version
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from myschedule import interactive
+
+COURSES = [
+    {"course_id": "A", "title": "Alpha"},
+    {"course_id": "B", "title": "Beta"},
+    {"course_id": "C", "title": "Gamma"},
+]
+EVENTS = [
+    {"course_id": "A", "date": "2026-02-19", "start": "10:00", "end": "12:00"},
+    {"course_id": "A", "date": "2026-02-20", "start": "08:00", "end": "09:00"},
+    {"course_id": "B", "date": "2026-02-19", "start": "11:00", "end": "13:00"},
+    {"course_id": "B", "date": "2026-02-20", "start": "09:00", "end": "10:00"},
+    {"course_id": "C", "date": "2026-02-19", "start": "10:00", "end": "11:00"},
+    {"course_id": "C", "date": "2026-02-21", "start": "10:00", "end": "11:00"},
+]
+
+
+class TestInteractiveIndexes(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        processed = Path(tmp.name)
+        (processed / "courses.json").write_text(json.dumps(COURSES), encoding="utf-8")
+        (processed / "events.json").write_text(json.dumps(EVENTS), encoding="utf-8")
+
+        self.processed = processed
+        with mock.patch.object(interactive, "PROCESSED_DIR", processed):
+            self.indexes = interactive.build_indexes()
+
+        # never touch the real selected_courses.json
+        patcher = mock.patch.object(interactive, "save_selected_course_ids")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _state(self, *cids: str) -> interactive.SelectedState:
+        state = interactive.SelectedState(ids=set(), events=[])
+        for cid in cids:
+            state.add(cid, self.indexes)
+        return state
+
+    def test_conflicts_if_added(self) -> None:
+        pairs = list(interactive._conflicts_if_added("A", self._state("B", "C"), self.indexes))
+        got = sorted((a["_cid"], b["_cid"], b["start"]) for a, b in pairs)
+        # A 10-12 overlaps B 11-13 and C 10-11; A 08-09 only touches B 09-10
+        self.assertEqual(got, [("A", "B", "11:00"), ("A", "C", "10:00")])
+
+    def test_touching_or_empty_selection_no_conflicts(self) -> None:
+        # C 10-11 ends when B 11-13 starts
+        self.assertEqual(
+            list(interactive._conflicts_if_added("C", self._state("B"), self.indexes)), []
+        )
+        self.assertEqual(
+            list(interactive._conflicts_if_added("C", self._state(), self.indexes)), []
+        )
+
+    def test_selected_state_matches_rebuild(self) -> None:
+        state = self._state("C", "A", "B")
+        state.remove("A")
+        fresh = interactive._selected_events({"B", "C"}, self.indexes.events_by_course_id)
+        self.assertEqual([id(e) for e in state.events], [id(e) for e in fresh])
+        self.assertEqual(state.ids, {"B", "C"})
+
+    def test_cached_rebuild_matches_and_gets_new_version(self) -> None:
+        self.assertTrue((self.processed / ".interactive_indexes.pkl").exists())
+        with mock.patch.object(
+            interactive, "_build_indexes", side_effect=AssertionError("cache not used")
+        ):
+            with mock.patch.object(interactive, "PROCESSED_DIR", self.processed):
+                cached = interactive.build_indexes()
+        self.assertEqual(cached.events_by_course_id, self.indexes.events_by_course_id)
+        self.assertEqual(cached.spans_by_course_and_date, self.indexes.spans_by_course_and_date)
+        # version-keyed caches must not mistake the reloaded copy for the old one
+        self.assertNotEqual(cached.version, self.indexes.version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Tests for the JSON helpers with optional orjson backend.
+
+Both backends must parse to the same objects and write byte-identical output,
+so metadata files don't change depending on what is installed.
+"""
+
+import unittest
+from unittest import mock
+
+from myschedule import jsonio
+
+DATA = {"semester": "HS25", "courses": 3, "title": "Einführung", "ids": ["A", "B"]}
+
+
+class TestJsonIO(unittest.TestCase):
+    def test_roundtrip(self) -> None:
+        self.assertEqual(jsonio.loads(jsonio.dumps_pretty(DATA)), DATA)
+
+    def test_stdlib_fallback_matches(self) -> None:
+        fast = jsonio.dumps_pretty(DATA)
+        with mock.patch.object(jsonio, "orjson", None):
+            slow = jsonio.dumps_pretty(DATA)
+            self.assertEqual(jsonio.loads(fast), DATA)
+        self.assertEqual(fast, slow)
+
+    def test_invalid_json_raises_decode_error(self) -> None:
+        for backend in (jsonio.orjson, None):
+            with mock.patch.object(jsonio, "orjson", backend):
+                with self.assertRaises((jsonio.JSONDecodeError, UnicodeDecodeError)):
+                    jsonio.loads(b"{not json")
+
+
+if __name__ == "__main__":
+    unittest.main()
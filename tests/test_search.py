@@ -0,0 +1,42 @@
+"""
+Tests for course search helpers.
+
+Search contract:
+- A course matches if the lowercased query is a substring of its haystack
+- The haystack contains course_id, title and instructor names (lowercased)
+"""
+
+import unittest
+
+from myschedule.search import build_search_index, course_haystack, iter_matches
+
+
+class TestSearch(unittest.TestCase):
+    def test_haystack_contains_id_title_and_instructors(self) -> None:
+        course = {
+            "course_id": " fs261059 ",
+            "title": "Corporate Finance",
+            "instructors": ["Prof. Dr. Jane Doe", None],
+        }
+        hay = course_haystack(course)
+        self.assertIn("fs261059", hay)
+        self.assertIn("corporate finance", hay)
+        self.assertIn("jane doe", hay)
+        self.assertNotIn("none", hay)
+
+    def test_haystack_handles_missing_fields(self) -> None:
+        hay = course_haystack(
+            {"course_id": "FS000001", "title": None, "instructors": "Single Name"}
+        )
+        self.assertEqual(hay, "fs000001  single name")
+
+    def test_iter_matches_finds_all_substring_hits_in_order(self) -> None:
+        haystacks = ["fs1 corporate finance", "fs2 public economics", "fs3 finance lab", "fs4 x"]
+        index = build_search_index(haystacks)
+        for query in ["finance", "fs", "f", "nce l", "x", "missing", "s4 x", "fs3", "lab", "fin"]:
+            expected = [i for i, h in enumerate(haystacks) if query in h]
+            self.assertEqual(list(iter_matches(index, query)), expected, query)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,6 +33,33 @@ class TestStorage(unittest.TestCase):
             self.assertIn("selected_course_ids", data)
             self.assertEqual(sorted(data["selected_course_ids"]), ["FS261059", "FS261110"])
 
+    def test_repeated_loads_return_independent_sets_and_see_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "selected_courses.json"
+            save_selected_course_ids({"FS261059"}, p)
+
+            first = load_selected_course_ids(p)
+            first.add("MUTATED")  # callers mutate the returned set in place
+            self.assertEqual(load_selected_course_ids(p), {"FS261059"})
+
+            # a file changed behind our back is picked up again
+            p.write_text(
+                json.dumps({"selected_course_ids": ["FS261059", "FS261110"]}), encoding="utf-8"
+            )
+            self.assertEqual(load_selected_course_ids(p), {"FS261059", "FS261110"})
+
+            p.unlink()
+            self.assertEqual(load_selected_course_ids(p), set())
+
+    def test_save_replaces_file_without_leftovers(self) -> None:
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "selected_courses.json"
+            save_selected_course_ids({"FS261059", "FS261110"}, p)
+            save_selected_course_ids({"FS261110"}, p)
+
+            self.assertEqual(load_selected_course_ids(p), {"FS261110"})
+            self.assertEqual([x.name for x in Path(d).iterdir()], ["selected_courses.json"])
+
 
 if __name__ == "__main__":
     unittest.main()